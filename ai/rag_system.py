@@ -102,14 +102,8 @@ class AIAssistantRAG:
         
         print("Building order embeddings...")
         
-        # Get all orders with optimized queries
-        orders = Order.objects.select_related(
-            'client_user', 'client_user__user_type', 'service'
-        ).prefetch_related(
-            'client_user__received_reviews',
-            'project_offers__technician_user',
-            'project_offers__technician_user__user_type'
-        )
+        # Get all orders with the relations the public serializer renders
+        orders = Order.objects.with_public_detail()
         
         serializer = PublicOrderSerializer(orders, many=True)
         order_data = serializer.data
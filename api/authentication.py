@@ -1,7 +1,10 @@
 from rest_framework import authentication, permissions
 from rest_framework.exceptions import AuthenticationFailed
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth.models import AnonymousUser
 from rest_framework import HTTP_HEADER_ENCODING
+from rest_framework_simplejwt.authentication import JWTAuthentication
 
 
 class CustomAuthentication(authentication.BaseAuthentication):
@@ -46,3 +49,39 @@ class IsAuthenticatedOrForbidden(permissions.BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
         return True
+
+
+class _UserModelWithUserType:
+    """
+    Stands in for the user model on SelectRelatedJWTAuthentication: simplejwt's
+    get_user looks the user up with ``user_model.objects.get(...)``, which then joins
+    the UserType.
+    """
+    def __init__(self, user_model):
+        self.DoesNotExist = user_model.DoesNotExist
+        self.objects = user_model._default_manager.select_related('user_type')
+
+
+class SelectRelatedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that loads the user's UserType in the same query,
+    so role checks later in the request don't need an extra fetch.
+    The user is still validated by simplejwt's get_user.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user_model = _UserModelWithUserType(self.user_model)
+
+
+class SelectRelatedModelBackend(ModelBackend):
+    """
+    ModelBackend that loads the session user's UserType in the same query, like
+    SelectRelatedJWTAuthentication does for token requests.
+    """
+    def get_user(self, user_id):
+        user_model = get_user_model()
+        try:
+            user = user_model._default_manager.select_related('user_type').get(pk=user_id)
+        except user_model.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
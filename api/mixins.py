@@ -29,7 +29,7 @@ class OwnerFilteredQuerysetMixin:
             # Object-level permissions will handle access control (403 if forbidden).
             return base_queryset
         
-        if user.is_authenticated and user.user_type.user_type_name == 'admin':
+        if user.is_authenticated and user.role_name == 'admin':
             return base_queryset # Admin sees all for list actions
         elif user.is_authenticated:
             return self.get_filtered_queryset(user, base_queryset) # Authenticated non-admin users get filtered for list actions
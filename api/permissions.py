@@ -1,8 +1,43 @@
+from django.core.exceptions import FieldDoesNotExist
 from rest_framework import permissions
 from rest_framework.exceptions import PermissionDenied
 from users.models import User
 from disputes.models import Dispute # Import Dispute model
 
+
+def cached(cls):
+    """
+    Class decorator that memoizes a permission's has_permission result on the request.
+    Composed permissions (A | B, A & B) can evaluate the same class several times
+    per request; the result cannot change within a request, so compute it once.
+    """
+    original_has_permission = cls.has_permission
+
+    def has_permission(self, request, view):
+        cache = getattr(request, '_perm_cache', None)
+        if cache is None:
+            cache = request._perm_cache = {}
+        if cls not in cache:
+            cache[cls] = original_has_permission(self, request, view)
+        return cache[cls]
+
+    cls.has_permission = has_permission
+    return cls
+
+
+def has_foreign_key(obj, name):
+    """
+    Whether obj's model has a foreign key called name. Unlike hasattr(obj, name), this
+    does not fetch the related row, so callers can then compare obj.<name>_id.
+    """
+    try:
+        field = obj._meta.get_field(name)
+    except (AttributeError, FieldDoesNotExist):
+        return False
+    return field.concrete and (field.many_to_one or field.one_to_one)
+
+
+@cached
 class IsClientUser(permissions.BasePermission):
     """
     Custom permission to only allow clients to access certain objects.
@@ -11,9 +46,10 @@ class IsClientUser(permissions.BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        user_type = request.user.user_type.user_type_name
+        user_type = request.user.role_name
         return user_type in ['client', 'technician']
 
+@cached
 class IsTechnicianUser(permissions.BasePermission):
     """
     Custom permission to only allow technicians to access certain objects.
@@ -21,14 +57,15 @@ class IsTechnicianUser(permissions.BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return request.user.user_type.user_type_name == 'technician'
+        return request.user.role_name == 'technician'
 
+@cached
 class IsAdminUser(permissions.BasePermission):
     """
     Custom permission to only allow admins to access certain objects.
     """
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.user_type.user_type_name == 'admin'
+        return request.user and request.user.is_authenticated and request.user.role_name == 'admin'
 
 class IsClientOrTechnicianUser(permissions.BasePermission):
     """
@@ -37,7 +74,7 @@ class IsClientOrTechnicianUser(permissions.BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        user_type_name = request.user.user_type.user_type_name
+        user_type_name = request.user.role_name
         return user_type_name == 'client' or user_type_name == 'technician'
 
 class IsAdminOrTechnicianUser(permissions.BasePermission):
@@ -47,7 +84,7 @@ class IsAdminOrTechnicianUser(permissions.BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        user_type_name = request.user.user_type.user_type_name
+        user_type_name = request.user.role_name
         return user_type_name == 'admin' or user_type_name == 'technician'
 
 class IsOwnerOrAdmin(permissions.BasePermission):
@@ -56,7 +93,7 @@ class IsOwnerOrAdmin(permissions.BasePermission):
     Assumes the object has an 'owner' attribute or is a User object.
     """
     def has_object_permission(self, request, view, obj):
-        if request.user and request.user.is_authenticated and request.user.user_type.user_type_name == 'admin':
+        if request.user and request.user.is_authenticated and request.user.role_name == 'admin':
             return True
         
         # For User objects, check against user_id
@@ -75,7 +112,7 @@ class IsConversationParticipantOrAdmin(permissions.BasePermission):
     Assumes the object is either a Conversation or has a 'conversation' attribute with a 'participants' ManyToManyField.
     """
     def has_object_permission(self, request, view, obj):
-        if request.user and request.user.is_authenticated and request.user.user_type.user_type_name == 'admin':
+        if request.user and request.user.is_authenticated and request.user.role_name == 'admin':
             return True
         
         if hasattr(obj, 'participants'): # For Conversation objects
@@ -90,14 +127,18 @@ class IsClientOwnerOrAdmin(permissions.BasePermission):
     Assumes the object has a 'client_user' attribute which is a User, or an 'order' attribute with a 'client_user' attribute.
     """
     def has_object_permission(self, request, view, obj):
-        if request.user and request.user.is_authenticated and request.user.user_type.user_type_name == 'admin':
+        if request.user and request.user.is_authenticated and request.user.role_name == 'admin':
             return True
         
-        if hasattr(obj, 'client_user'):
-            if obj.client_user == request.user:
+        if not request.user or not request.user.is_authenticated:
+            return False
+
+        # Compare foreign key ids so the owner row is never fetched just for the check
+        if hasattr(obj, 'client_user_id'):
+            if obj.client_user_id == request.user.pk:
                 return True
-        elif hasattr(obj, 'order') and hasattr(obj.order, 'client_user'):
-            if obj.order.client_user == request.user:
+        elif hasattr(obj, 'order') and hasattr(obj.order, 'client_user_id'):
+            if obj.order.client_user_id == request.user.pk:
                 return True
         
         return False # Return False to allow other permissions to run or default DRF behavior
@@ -108,10 +149,12 @@ class IsTechnicianOwnerOrAdmin(permissions.BasePermission):
     Assumes the object has a 'technician_user' attribute which is a User.
     """
     def has_object_permission(self, request, view, obj):
-        if request.user and request.user.is_authenticated and request.user.user_type.user_type_name == 'admin':
+        if request.user and request.user.is_authenticated and request.user.role_name == 'admin':
             return True
-        if hasattr(obj, 'technician_user'):
-            if obj.technician_user == request.user:
+        if not request.user or not request.user.is_authenticated:
+            return False
+        if hasattr(obj, 'technician_user_id'):
+            if obj.technician_user_id == request.user.pk:
                 return True
         
         return False # Return False to allow other permissions to run or default DRF behavior
@@ -122,23 +165,24 @@ class IsUserOwnerOrAdmin(permissions.BasePermission):
     Assumes the object has a 'user' attribute which is a User.
     """
     def has_object_permission(self, request, view, obj):
-        if request.user and request.user.is_authenticated and request.user.user_type.user_type_name == 'admin':
+        if request.user and request.user.is_authenticated and request.user.role_name == 'admin':
             return True
-        if hasattr(obj, 'user'):
-            if obj.user == request.user:
+        # Compare foreign key ids throughout, so no user row is fetched for the check
+        if has_foreign_key(obj, 'user'):
+            if obj.user_id == request.user.pk:
                 return True
-        elif hasattr(obj, 'reporter'):
-            if obj.reporter == request.user:
+        elif has_foreign_key(obj, 'reporter'):
+            if obj.reporter_id == request.user.pk:
                 return True
         # For Dispute objects, check against initiator or order participants
         if isinstance(obj, Dispute):
-            if request.user == obj.initiator:
+            if obj.initiator_id == request.user.pk:
                 return True
-            if obj.order and (request.user == obj.order.client_user or request.user == obj.order.technician_user):
+            if obj.order and request.user.pk in (obj.order.client_user_id, obj.order.technician_user_id):
                 return True
         # For Transaction objects, check against source_user or destination_user
-        if hasattr(obj, 'source_user') and hasattr(obj, 'destination_user'):
-            if request.user == obj.source_user or request.user == obj.destination_user:
+        if has_foreign_key(obj, 'source_user') and has_foreign_key(obj, 'destination_user'):
+            if request.user.pk in (obj.source_user_id, obj.destination_user_id):
                 return True
         
         # If no specific ownership is found, deny permission
@@ -150,9 +194,9 @@ class IsMessageSenderOrAdmin(permissions.BasePermission):
     Assumes the object has a 'sender' attribute which is a User.
     """
     def has_object_permission(self, request, view, obj):
-        if request.user and request.user.is_authenticated and request.user.user_type.user_type_name == 'admin':
+        if request.user and request.user.is_authenticated and request.user.role_name == 'admin':
             return True
-        return obj.sender == request.user
+        return obj.sender_id == request.user.pk
 
 class IsReviewOwnerOrAdmin(permissions.BasePermission):
     """
@@ -160,10 +204,10 @@ class IsReviewOwnerOrAdmin(permissions.BasePermission):
     Assumes the object has a 'client_user' attribute which is a User.
     """
     def has_object_permission(self, request, view, obj):
-        if request.user and request.user.is_authenticated and request.user.user_type.user_type_name == 'admin':
+        if request.user and request.user.is_authenticated and request.user.role_name == 'admin':
             return True
-        if hasattr(obj, 'reviewer'):
-            return obj.reviewer == request.user
+        if has_foreign_key(obj, 'reviewer'):
+            return obj.reviewer_id == request.user.pk
         raise PermissionDenied("You do not have permission to access this object.")
 
 class IsReviewTechnicianOrAdmin(permissions.BasePermission):
@@ -172,11 +216,11 @@ class IsReviewTechnicianOrAdmin(permissions.BasePermission):
     Assumes the object has a 'technician' attribute which is a User.
     """
     def has_object_permission(self, request, view, obj):
-        if request.user and request.user.is_authenticated and request.user.user_type.user_type_name == 'admin':
+        if request.user and request.user.is_authenticated and request.user.role_name == 'admin':
             return True
-        if hasattr(obj, 'technician') and obj.technician == request.user:
+        if has_foreign_key(obj, 'technician') and obj.technician_id == request.user.pk:
             return True
-        if hasattr(obj, 'reviewer') and obj.reviewer == request.user:
+        if has_foreign_key(obj, 'reviewer') and obj.reviewer_id == request.user.pk:
             return True
         raise PermissionDenied("You do not have permission to access this object.")
 
@@ -209,7 +253,7 @@ class IsDisputeParticipantOrAdmin(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.user and request.user.is_authenticated:
             # Admins always have permission
-            if request.user.user_type.user_type_name == 'admin':
+            if request.user.role_name == 'admin':
                 return True
             
             # Check if user is the initiator of the dispute
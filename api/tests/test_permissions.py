@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from api.permissions import (
+    IsAdminUser, IsClientOwnerOrAdmin, IsClientUser, IsTechnicianOwnerOrAdmin, IsTechnicianUser,
+)
+from orders.models import ProjectOffer
+from orders.tests.factories import OrderTestCase, create_order, create_user
+from users.models import User
+
+
+class CachedPermissionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.technician = create_user('perm-tech@example.com', 'technician')
+
+    def _request(self):
+        view = APIView()
+        request = view.initialize_request(APIRequestFactory().get('/'))
+        request.user = self.technician
+        return request, view
+
+    def test_has_permission_evaluated_once_per_request(self):
+        request, view = self._request()
+        composed = (IsAdminUser | (IsTechnicianUser & IsClientUser))()
+        with mock.patch.object(
+            User, 'role_name', new_callable=mock.PropertyMock, return_value='technician'
+        ) as role_name:
+            self.assertTrue(composed.has_permission(request, view))
+            self.assertTrue(composed.has_permission(request, view))
+        # One role lookup per permission class, however often the composition is evaluated
+        self.assertEqual(role_name.call_count, 3)
+
+    def test_cache_is_scoped_to_the_request(self):
+        first, view = self._request()
+        second, _ = self._request()
+        self.assertTrue(IsTechnicianUser().has_permission(first, view))
+        self.assertNotIn(IsTechnicianUser, getattr(second, '_perm_cache', {}))
+
+
+class OwnerPermissionQueryTests(OrderTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        order = create_order(cls.client_user, cls.service)
+        cls.offer = ProjectOffer.objects.create(
+            order=order, technician_user=cls.technician_user, offered_price=100, offer_date='2025-02-01'
+        )
+
+    def _request(self, user):
+        view = APIView()
+        request = view.initialize_request(APIRequestFactory().get('/'))
+        request.user = user
+        return request, view
+
+    def test_owner_checks_compare_ids_without_queries(self):
+        # The offer as loaded by ProjectOfferViewset for detail actions
+        offer = ProjectOffer.objects.select_related('order').get(pk=self.offer.pk)
+        client_request, view = self._request(self.client_user)
+        technician_request, _ = self._request(self.technician_user)
+        with self.assertNumQueries(0):
+            self.assertTrue(IsClientOwnerOrAdmin().has_object_permission(client_request, view, offer))
+            self.assertFalse(IsClientOwnerOrAdmin().has_object_permission(technician_request, view, offer))
+            self.assertTrue(IsTechnicianOwnerOrAdmin().has_object_permission(technician_request, view, offer))
+            self.assertFalse(IsTechnicianOwnerOrAdmin().has_object_permission(client_request, view, offer))
@@ -0,0 +1,8 @@
+def get_user_role(user):
+    """
+    Return the role name ('admin', 'client', 'technician', ...) for the given user,
+    or None for anonymous users. See User.role_name for how the lookup is cached.
+    """
+    if user is None or not user.is_authenticated:
+        return None
+    return user.role_name
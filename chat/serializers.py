@@ -149,7 +149,7 @@ class ConversationSerializer(serializers.ModelSerializer):
                 'username': user.username,
                 'full_name': user.get_full_name(),
                 'profile_photo': user.profile_photo.url if (user.profile_photo and hasattr(user.profile_photo, 'url')) else None,
-                'user_type': user.user_type.user_type_name if user.user_type else None,
+                'user_type': user.role_name,
                 'is_online': getattr(user, 'is_online', False) # If online status tracking is added
             }
             for user in participants
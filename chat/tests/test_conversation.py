@@ -168,3 +168,17 @@ class ConversationTests(APITestCase):
         response = client.delete(self.detail_url1)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(Conversation.objects.filter(id=self.conversation1.id).exists(), False)
+
+    def test_get_with_user_reuses_only_the_two_person_conversation(self):
+        group = Conversation.objects.create()
+        group.participants.add(self.client_user, self.technician_user, self.other_client_user)
+        client = self.get_auth_client(self.client_user)
+        url = reverse('conversation-get-with-user', args=[self.technician_user.user_id])
+        response = client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], self.conversation1.id)
+
+        self.conversation1.delete()
+        response = client.get(url)
+        self.assertNotIn(response.data['id'], (self.conversation1.id, group.id))
+        self.assertEqual(Conversation.objects.count(), 3)
@@ -3,7 +3,7 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework import serializers
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from django.db.models import Prefetch, Count
+from django.db.models import Count, Exists, OuterRef, Prefetch
 from django.core.paginator import Paginator
 from .models import Conversation, Message
 from .serializers import ConversationSerializer, MessageSerializer
@@ -87,7 +87,7 @@ class ConversationViewSet(viewsets.ModelViewSet):
         user = request.user
         
         # Verify user is participant
-        if user.user_type.user_type_name != 'admin' and user not in conversation.participants.all():
+        if user.role_name != 'admin' and user not in conversation.participants.all():
             raise PermissionDenied("You are not a participant in this conversation.")
         
         # Pagination
@@ -135,20 +135,16 @@ class ConversationViewSet(viewsets.ModelViewSet):
         except User.DoesNotExist:
             return Response({'error': 'Target user not found'}, status=404)
         
-        # Find existing conversation with these two users
-        conversations = Conversation.objects.filter(
-            participants=current_user
-        ).filter(
-            participants=target_user
-        ).filter(
-            participants__in=[current_user, target_user]
-        ).distinct()
-        
-        conversation = None
-        for conv in conversations:
-            if set(conv.participants.values_list('user_id', flat=True)) == {current_user.user_id, target_user.user_id}:
-                conversation = conv
-                break
+        # Find the existing conversation between exactly these two users in one query:
+        # EXISTS semi-joins on the participants table instead of joining it and
+        # de-duplicating with DISTINCT, then checking each candidate's participants
+        participant_rows = Conversation.participants.through.objects.filter(conversation=OuterRef('pk'))
+        conversation = Conversation.objects.filter(
+            Exists(participant_rows.filter(user=current_user)),
+            Exists(participant_rows.filter(user=target_user)),
+        ).exclude(
+            Exists(participant_rows.exclude(user__in=[current_user, target_user]))
+        ).order_by('pk').first()
         
         if not conversation:
             # Create new conversation with two participants
@@ -165,7 +161,7 @@ class ConversationViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("Authentication required to create conversations.")
         
         participants_data = self.request.data.get('participants')
-        if user.user_type.user_type_name != 'admin':
+        if user.role_name != 'admin':
             if not participants_data or user.user_id not in participants_data:
                 raise serializers.ValidationError({"participants": "The authenticated user must be a participant in the conversation."})
         
@@ -251,7 +247,7 @@ class MessageViewSet(viewsets.ModelViewSet):
         except Conversation.DoesNotExist:
             raise serializers.ValidationError({"conversation": "Conversation does not exist."})
         
-        if user.user_type.user_type_name != 'admin' and user not in conversation.participants.all():
+        if user.role_name != 'admin' and user not in conversation.participants.all():
             raise PermissionDenied("You are not a participant in this conversation.")
         
         serializer.save(sender=user, conversation=conversation)
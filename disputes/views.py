@@ -90,12 +90,12 @@ class DisputeViewSet(viewsets.ModelViewSet):
             return Dispute.objects.none()
 
         if self.action == 'list':
-            if user.user_type.user_type_name == 'admin':
+            if user.role_name == 'admin':
                 return Dispute.objects.all().order_by('-created_at')
             # Changed to filter for both initiator (client) and technician_user (from related order)
-            elif user.user_type.user_type_name == 'client':
+            elif user.role_name == 'client':
                 return Dispute.objects.filter(initiator=user).order_by('-created_at')
-            elif user.user_type.user_type_name == 'technician':
+            elif user.role_name == 'technician':
                 return Dispute.objects.filter(order__technician_user=user).order_by('-created_at')
             return Dispute.objects.none()
         
@@ -345,7 +345,7 @@ class DisputeViewSet(viewsets.ModelViewSet):
         # Determine if user is client or technician
         is_client = user == order.client_user
         is_technician = user == order.technician_user
-        is_admin = user.user_type.user_type_name == 'admin'
+        is_admin = user.role_name == 'admin'
 
         if not (is_client or is_technician or is_admin):
             raise PermissionDenied("You are not authorized to respond to this dispute.")
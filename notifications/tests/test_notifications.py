@@ -2,6 +2,7 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from django.urls import reverse
 from ..models import Notification
+from ..utils import create_notifications_bulk
 from users.models import User, UserType
 
 class NotificationTests(APITestCase):
@@ -173,3 +174,30 @@ class NotificationTests(APITestCase):
         response = self.client.delete(self.detail_url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(Notification.objects.count(), 1) # One deleted
+
+
+class CreateNotificationsBulkTests(APITestCase):
+    def test_one_insert_for_all_users(self):
+        users = [
+            User.objects.create_user(email=f'bulk{i}@example.com', user_type_name='technician')
+            for i in range(3)
+        ]
+        with self.assertNumQueries(1):
+            create_notifications_bulk(
+                [user.pk for user in users], notification_type='new_project_available', title='Title', message='Body'
+            )
+        self.assertEqual(
+            set(Notification.objects.values_list('user_id', flat=True)), {user.pk for user in users}
+        )
+
+    def test_streams_ids_one_batch_at_a_time(self):
+        users = [
+            User.objects.create_user(email=f'stream{i}@example.com', user_type_name='admin')
+            for i in range(3)
+        ]
+        user_ids = User.objects.filter(pk__in=[user.pk for user in users]).values_list('pk', flat=True)
+        with self.assertNumQueries(3): # The id query, then two INSERTs of at most two rows
+            create_notifications_bulk(
+                user_ids.iterator(), notification_type='dispute_new', title='Title', message='Body', batch_size=2
+            )
+        self.assertEqual(Notification.objects.count(), 3)
@@ -1,3 +1,6 @@
+from itertools import islice
+
+from django.db import transaction
 from .models import Notification
 from users.models import User
 from orders.models import Order, ProjectOffer # Import ProjectOffer
@@ -18,6 +21,50 @@ def create_notification(user, notification_type, title, message, related_order=N
         related_dispute=related_dispute # Add related_dispute field
     )
 
+def create_notifications_bulk(user_ids, notification_type, title, message, related_order=None, related_offer=None, related_dispute=None, batch_size=500):
+    """
+    Create the same notification for every user in user_ids with batched INSERTs,
+    instead of one create_notification call (and INSERT) per user. user_ids may be any
+    iterable, e.g. a values_list(...).iterator(); it is consumed one batch at a time,
+    so at most batch_size notifications are held in memory.
+    """
+    user_ids = iter(user_ids)
+    while batch := [
+        Notification(
+            user_id=user_id,
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            related_order=related_order,
+            related_offer=related_offer,
+            related_dispute=related_dispute,
+        )
+        for user_id in islice(user_ids, batch_size)
+    ]:
+        Notification.objects.bulk_create(batch)
+
+def create_notification_on_commit(**kwargs):
+    """
+    Create a notification (same arguments as create_notification) once the current
+    transaction commits. The notification is not written if the transaction rolls
+    back, and a failure to write it is logged without undoing the caller's work.
+    """
+    transaction.on_commit(lambda: create_notification(**kwargs), robust=True)
+
+def create_notifications_bulk_on_commit(**kwargs):
+    """
+    create_notifications_bulk (same arguments), run once the current transaction
+    commits, like create_notification_on_commit.
+    """
+    transaction.on_commit(lambda: create_notifications_bulk(**kwargs), robust=True)
+
+def save_notifications_on_commit(notifications):
+    """
+    Insert unsaved Notification instances, which may differ in user and type, with
+    one bulk_create once the current transaction commits, like create_notification_on_commit.
+    """
+    transaction.on_commit(lambda: Notification.objects.bulk_create(notifications, batch_size=500), robust=True)
+
 def get_notification_frontend_url(notification):
     """
     Generate the appropriate frontend URL for a notification based on notification type and context.
@@ -53,7 +53,7 @@ class NotificationPreferenceViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelVi
             # For these actions, return the full queryset and let object-level permissions handle access
             return base_queryset
         # For 'list' action, filter by owner
-        if user.user_type.user_type_name == 'client':
+        if user.role_name == 'client':
             return base_queryset.filter(user=user)
         return base_queryset.none()
 
@@ -62,11 +62,11 @@ class NotificationPreferenceViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelVi
         if not user.is_authenticated:
             raise PermissionDenied("Authentication required to create notification preferences.")
 
-        if user.user_type.user_type_name == 'client':
+        if user.role_name == 'client':
             if 'user' in self.request.data and self.request.data['user'] != user.user_id:
                 raise PermissionDenied("Clients can only create notification preferences for themselves.")
             serializer.save(user=user)
-        elif user.user_type.user_type_name == 'admin':
+        elif user.role_name == 'admin':
             if 'user' not in self.request.data:
                 raise serializers.ValidationError({"user": "This field is required for admin users."})
             serializer.save()
@@ -119,7 +119,7 @@ class NotificationViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
         user = self.request.user
         base_queryset = super().get_queryset() # Get the initial queryset from the next class in MRO (e.g., ModelViewSet)
 
-        if user.is_authenticated and user.user_type.user_type_name == 'admin':
+        if user.is_authenticated and user.role_name == 'admin':
             return base_queryset.filter(user=user) # Admin sees only their own notifications
         elif user.is_authenticated:
             # Authenticated non-admin users get filtered for all actions (list, retrieve, update, destroy)
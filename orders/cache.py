@@ -0,0 +1,86 @@
+"""
+Caching of order, worker-task and project-offer list responses.
+
+Entries are keyed on a shared version number, the user, their role and the full
+request path (query string included); lists that are the same for everyone (the
+public open-order board) leave out the user and role. Any write to the data the lists render bumps
+the version (see orders.signals), which orphans every cached list at once.
+The ids of the admin users, whom new disputes notify, are cached under their own key,
+dropped whenever a user is saved or deleted. Both caches are disabled unless
+settings.ORDER_LIST_CACHE_TIMEOUT is positive.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+from api.utils import get_user_role
+from users.models import User
+
+VERSION_KEY = 'orders:list-version'
+ADMIN_IDS_KEY = 'orders:admin-ids'
+
+
+def get_timeout():
+    return getattr(settings, 'ORDER_LIST_CACHE_TIMEOUT', 0)
+
+
+def invalidate_list_cache():
+    """Orphan every cached order/offer list."""
+    if get_timeout() <= 0:
+        return
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, None)
+
+
+def _cache_key(prefix, request, per_user):
+    version = cache.get_or_set(VERSION_KEY, 1, None)
+    path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+    if not per_user:
+        return f'orders:list:{version}:{prefix}:{path}'
+    user = request.user
+    return f'orders:list:{version}:{prefix}:{user.pk}:{get_user_role(user)}:{path}'
+
+
+def cached_list_response(prefix, request, build_response, per_user=True):
+    """
+    Return the cached list response for this user and request, or call
+    build_response() and cache its data if it succeeded. With per_user=False one
+    entry per request path is shared by every caller, anonymous ones included.
+    """
+    timeout = get_timeout()
+    if timeout <= 0 or (per_user and not request.user.is_authenticated):
+        return build_response()
+
+    key = _cache_key(prefix, request, per_user)
+    data = cache.get(key)
+    if data is not None:
+        return Response(data)
+
+    response = build_response()
+    if response.status_code == status.HTTP_200_OK:
+        cache.set(key, response.data, timeout)
+    return response
+
+
+def get_admin_ids():
+    """The primary keys of all admin users, from the cache when it is enabled."""
+    timeout = get_timeout()
+    if timeout <= 0:
+        return list(User.objects.filter(user_type__user_type_name='admin').values_list('pk', flat=True))
+    return cache.get_or_set(
+        ADMIN_IDS_KEY,
+        lambda: list(User.objects.filter(user_type__user_type_name='admin').values_list('pk', flat=True)),
+        timeout,
+    )
+
+
+def invalidate_admin_ids():
+    """Drop the cached admin ids."""
+    if get_timeout() <= 0:
+        return
+    cache.delete(ADMIN_IDS_KEY)
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-17 15:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0006_alter_order_order_status_and_more'),
+        ('services', '0003_service_arabic_name_servicecategory_arabic_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['order_status', 'auto_release_date'], name='ORDER_order_s_fc42c2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('order_status', 'OPEN'), ('technician_user__isnull', True)), fields=['-order_id'], name='ORDER_open_board_idx'),
+        ),
+    ]
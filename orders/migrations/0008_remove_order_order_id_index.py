@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-17 17:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0007_order_auto_release_and_open_board_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='ORDER_order_i_0ba98d_idx',
+        ),
+    ]
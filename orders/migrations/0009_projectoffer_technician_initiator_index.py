@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-17 18:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0008_remove_order_order_id_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='projectoffer',
+            name='PROJECT_OFF_technic_60ef06_idx',
+        ),
+        migrations.AddIndex(
+            model_name='projectoffer',
+            index=models.Index(fields=['technician_user', 'status', 'offer_initiator', '-offer_date', '-offer_id'], name='PROJECT_OFF_technic_5d9d60_idx'),
+        ),
+    ]
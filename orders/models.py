@@ -3,6 +3,17 @@ from users.models import User
 from services.models import Service
 from datetime import date
 
+class OrderQuerySet(models.QuerySet):
+    def with_public_detail(self):
+        """
+        The relations PublicOrderSerializer renders: the service with its category and
+        the client with their user type and received reviews.
+        """
+        return self.select_related(
+            'client_user__user_type', 'service__category'
+        ).prefetch_related('client_user__received_reviews')
+
+
 class Order(models.Model):
     ORDER_TYPE_CHOICES = [
         ('direct_hire', 'Direct Hire'),
@@ -52,6 +63,8 @@ class Order(models.Model):
     total_amount_paid_by_client = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     amount_to_technician = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
 
+    objects = OrderQuerySet.as_manager()
+
     class Meta:
         db_table = 'ORDER' # Explicitly set table name to match SQL
         indexes = [
@@ -60,8 +73,13 @@ class Order(models.Model):
             models.Index(fields=['order_status', '-order_id']),  # For status-based queries
             models.Index(fields=['creation_timestamp', '-order_id']),  # For chronological queries
             models.Index(fields=['client_user', 'order_status', '-order_id']),  # For client + status queries
-            models.Index(fields=['technician_user', 'order_status', '-order_id']),  # For technician + status queries
-            models.Index(fields=['order_id']),  # For direct order lookups
+            models.Index(fields=['technician_user', 'order_status', '-order_id']),  # For technician + status queries (worker-tasks, newest first)
+            models.Index(fields=['order_status', 'auto_release_date']),  # For the auto-release sweep
+            models.Index(  # For the public board of open, unassigned orders (available_for_offer)
+                fields=['-order_id'],
+                condition=models.Q(technician_user__isnull=True, order_status='OPEN'),
+                name='ORDER_open_board_idx',
+            ),
         ]
 
     def __str__(self):
@@ -119,7 +137,9 @@ class ProjectOffer(models.Model):
         db_table = 'PROJECT_OFFER'
         indexes = [
             models.Index(fields=['order', 'status']),  # For getting offers by order and status
-            models.Index(fields=['technician_user', 'status']),  # For technician's offers by status
+            # For technician's offers by status, and by initiator too (client offers awaiting
+            # the technician), already in the newest-first order those lists use
+            models.Index(fields=['technician_user', 'status', 'offer_initiator', '-offer_date', '-offer_id']),
             models.Index(fields=['order', 'offer_initiator', 'status']),  # For order + initiator + status queries
             models.Index(fields=['offer_date', '-offer_id']),  # For chronological queries
         ]
@@ -0,0 +1,50 @@
+"""
+Row-level visibility rules for orders and project offers.
+
+Each rule maps a role name to a function returning the Q filter for the rows that
+role may list, so a viewset resolves visibility in one query (and one COUNT for
+pagination) instead of branching per role.
+"""
+from django.db.models import Q
+
+from api.utils import get_user_role
+
+
+# Admin visibility follows the 'admin' user type, not is_superuser/is_staff: superusers
+# are created with the default 'client' type unless told otherwise, and admin-type
+# accounts need not be superusers. The role itself is free to read once the user is
+# loaded with user_type (see User.role_name), so a flag-based shortcut saves nothing.
+#
+# Technicians also place orders as customers; the jobs assigned to them are listed
+# through worker-tasks, so the generic order list only shows orders they created.
+ORDER_VISIBILITY_RULES = {
+    'admin': lambda user: Q(),
+    'client': lambda user: Q(client_user=user),
+    'technician': lambda user: Q(client_user=user),
+}
+
+PROJECT_OFFER_VISIBILITY_RULES = {
+    'admin': lambda user: Q(),
+    'client': lambda user: Q(order__client_user=user),
+    'technician': lambda user: Q(technician_user=user),
+}
+
+
+def _visible_to(rules, user):
+    rule = rules.get(get_user_role(user))
+    return rule(user) if rule else None
+
+
+def orders_visible_to(user, me=False):
+    """
+    Return the Q filter for the orders `user` may list, or None if they may list none.
+    With `me`, admins are restricted to their own orders like any client.
+    """
+    if me and get_user_role(user) == 'admin':
+        return ORDER_VISIBILITY_RULES['client'](user)
+    return _visible_to(ORDER_VISIBILITY_RULES, user)
+
+
+def project_offers_visible_to(user):
+    """Return the Q filter for the project offers `user` may list, or None if they may list none."""
+    return _visible_to(PROJECT_OFFER_VISIBILITY_RULES, user)
@@ -123,8 +123,9 @@ class OrderSerializer(serializers.ModelSerializer):
     associated_offer = serializers.SerializerMethodField()
     project_offers = ProjectOfferDetailSerializer(many=True, read_only=True) # Added to display all offers
     dispute = serializers.SerializerMethodField()
-    review_rating = serializers.IntegerField(read_only=True, allow_null=True)
-    review_comment = serializers.CharField(read_only=True, allow_null=True, required=False)
+    # From the order's one-to-one review (select_related by the order viewsets); None without one
+    review_rating = serializers.IntegerField(source='review.rating', read_only=True, allow_null=True)
+    review_comment = serializers.CharField(source='review.comment', read_only=True, allow_null=True, required=False)
 
     # Define order_type as a CharField with choices for validation
     order_type = serializers.ChoiceField(choices=Order.ORDER_TYPE_CHOICES, required=True)
@@ -198,10 +199,24 @@ class OrderSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['order_id', 'creation_timestamp', 'order_status', 'technician_user'] # Removed 'order_type'
 
+class TechnicianPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Technician primary key field that resolves to the already-loaded request.user
+    when a technician submits their own id, instead of fetching the same row again.
+    """
+    def to_internal_value(self, data):
+        request = self.context.get('request')
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated and user.role_name == 'technician':
+            if str(data) == str(user.pk):
+                return user
+        return super().to_internal_value(data)
+
 class ProjectOfferSerializer(serializers.ModelSerializer):
-    technician_user = serializers.PrimaryKeyRelatedField(queryset=User.objects.filter(user_type__user_type_name='technician'))
+    technician_user = TechnicianPrimaryKeyRelatedField(queryset=User.objects.filter(user_type__user_type_name='technician'))
     offer_initiator = serializers.CharField(read_only=True)
-    order = serializers.PrimaryKeyRelatedField(queryset=Order.objects.all())
+    # client_user is loaded with the order because offer creation notifies the client
+    order = serializers.PrimaryKeyRelatedField(queryset=Order.objects.select_related('client_user'))
 
     class Meta:
         model = ProjectOffer
@@ -245,14 +260,15 @@ class ClientMakeOfferSerializer(serializers.ModelSerializer):
         # Ensure order_type is set for the order being created
         order_data['order_type'] = 'direct_hire' # ClientMakeOfferSerializer specifically creates direct_hire orders
         order_data['creation_timestamp'] = date.today()
-        order_data['order_status'] = 'AWAITING_TECHNICIAN_RESPONSE'
 
         # Set final_price in order_data using client_agreed_price
         order_data['final_price'] = client_agreed_price
 
         order_serializer = OrderSerializer(data=order_data, context=self.context)
         order_serializer.is_valid(raise_exception=True)
-        order = order_serializer.save(client_user=client_user) # Pass client_user directly to save()
+        # order_status is read-only on OrderSerializer, so pass it to save() to insert the
+        # order with its final status instead of updating it afterwards
+        order = order_serializer.save(client_user=client_user, order_status='AWAITING_TECHNICIAN_RESPONSE')
 
         offer = ProjectOffer.objects.create(
             order=order,
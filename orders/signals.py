@@ -0,0 +1,33 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from disputes.models import Dispute
+from reviews.models import Review
+from users.models import User
+from .cache import invalidate_admin_ids, invalidate_list_cache
+from .models import Order, ProjectOffer
+
+
+@receiver([post_save, post_delete], sender=Order)
+@receiver([post_save, post_delete], sender=ProjectOffer)
+@receiver([post_save, post_delete], sender=Dispute)
+@receiver([post_save, post_delete], sender=Review)
+def invalidate_order_lists(sender, **kwargs):
+    """
+    Orders, their offers, disputes and reviews are all rendered in the cached lists.
+    Invalidate now and again on commit, so a list cached by another request before
+    this transaction commits cannot outlive it.
+    """
+    invalidate_list_cache()
+    transaction.on_commit(invalidate_list_cache)
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_admin_id_cache(sender, **kwargs):
+    """
+    Any user can gain or lose the admin role, so drop the cached admin ids on every
+    user write, now and again on commit (see invalidate_order_lists).
+    """
+    invalidate_admin_ids()
+    transaction.on_commit(invalidate_admin_ids)
@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the order tests: builders for users, a service and orders, and
+a base TestCase that creates a client, a technician and a service once per class.
+"""
+from django.test import TestCase
+
+from orders.models import Order
+from services.models import Service, ServiceCategory
+from users.models import User
+
+
+def create_user(email, user_type_name='client', **extra_fields):
+    return User.objects.create_user(email=email, user_type_name=user_type_name, **extra_fields)
+
+
+def create_service(service_name='TestService'):
+    category = ServiceCategory.objects.create(category_name=f'{service_name}Category')
+    return Service.objects.create(
+        category=category, service_name=service_name, service_type='Repair', base_inspection_fee=50.00
+    )
+
+
+def create_order(client_user, service, **fields):
+    """Create a service request order; fields override the defaults."""
+    fields = {
+        'order_type': 'service_request',
+        'problem_description': 'Test order',
+        'requested_location': '123 Main St',
+        'scheduled_date': '2025-02-01',
+        'scheduled_time_start': '10:00',
+        'scheduled_time_end': '12:00',
+        **fields,
+    }
+    return Order.objects.create(client_user=client_user, service=service, **fields)
+
+
+class OrderTestCase(TestCase):
+    """Creates client_user, technician_user and service; subclasses add their own rows."""
+    service_name = 'TestService'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.client_user = create_user('client@example.com')
+        cls.technician_user = create_user('tech@example.com', 'technician')
+        cls.service = create_service(cls.service_name)
+
+    def create_order(self, client_user=None, **fields):
+        return create_order(client_user or self.client_user, self.service, **fields)
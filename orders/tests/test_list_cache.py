@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from orders.cache import get_admin_ids
+from orders.tests.factories import OrderTestCase, create_user
+
+
+@override_settings(ORDER_LIST_CACHE_TIMEOUT=60)
+class OrderListCacheTests(OrderTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_client = create_user('cache-other@example.com')
+
+    def setUp(self):
+        cache.clear()
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.client_user)
+
+    def test_repeated_list_is_served_from_cache(self):
+        self.create_order()
+        first = self.api.get('/api/orders/')
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.api.get('/api/orders/')
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_order_write_invalidates_cached_lists(self):
+        self.assertEqual(self.api.get('/api/orders/').data['count'], 0)
+        self.create_order()
+        self.assertEqual(self.api.get('/api/orders/').data['count'], 1)
+
+    def test_cache_is_per_user(self):
+        self.create_order()
+        self.assertEqual(self.api.get('/api/orders/').data['count'], 1)
+        other = APIClient()
+        other.force_authenticate(user=self.other_client)
+        self.assertEqual(other.get('/api/orders/').data['count'], 0)
+
+    def test_worker_tasks_list_is_cached_and_invalidated(self):
+        self.api.force_authenticate(user=self.technician_user)
+        self.assertEqual(self.api.get('/api/orders/worker-tasks/').data['count'], 0)
+        with CaptureQueriesContext(connection) as ctx:
+            self.api.get('/api/orders/worker-tasks/')
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.create_order(technician_user=self.technician_user)
+        self.assertEqual(self.api.get('/api/orders/worker-tasks/').data['count'], 1)
+
+    def test_open_order_board_is_shared_and_invalidated(self):
+        self.create_order()
+        anonymous = APIClient()
+        first = anonymous.get('/api/orders/available-for-offer/')
+        self.assertEqual(first.data['count'], 1)
+        # Another caller, here an authenticated technician, gets the same cached page
+        self.api.force_authenticate(user=self.technician_user)
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.api.get('/api/orders/available-for-offer/')
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.create_order(self.other_client)
+        self.assertEqual(anonymous.get('/api/orders/available-for-offer/').data['count'], 2)
+
+    def test_admin_ids_are_cached_until_a_user_changes(self):
+        admin = create_user('cache-admin@example.com', 'admin')
+        self.assertEqual(get_admin_ids(), [admin.pk])
+        with self.assertNumQueries(0):
+            self.assertEqual(get_admin_ids(), [admin.pk])
+        other_admin = create_user('cache-admin2@example.com', 'admin')
+        self.assertEqual(sorted(get_admin_ids()), sorted([admin.pk, other_admin.pk]))
@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.test import TestCase
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -5,7 +7,11 @@ from datetime import date, datetime
 from django.utils import timezone
 from users.models import UserType, User
 from services.models import ServiceCategory, Service
-from orders.models import Order
+from orders.models import Order, ProjectOffer
+from orders.tests.factories import OrderTestCase, create_order
+from orders.views import OrderPagination, WorkerTasksViewSet
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from django.contrib.auth.hashers import make_password
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -250,3 +256,123 @@ class OrderAPITests(TestCase):
         response = client.delete(self.detail_url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(Order.objects.count(), 0) # 1 initially, 1 deleted, 0 remaining
+
+
+class OrderListTests(OrderTestCase):
+    """Order list query count and pagination."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.client_user)
+
+    def _create_orders(self, count):
+        for _ in range(count):
+            order = self.create_order()
+            ProjectOffer.objects.create(
+                order=order,
+                technician_user=self.technician_user,
+                offered_price=100,
+                offer_date=date.today(),
+            )
+
+    def _count_list_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/orders/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries)
+
+    def test_list_query_count_independent_of_page_size(self):
+        self._create_orders(1)
+        single = self._count_list_queries()
+        self._create_orders(4)
+        self.assertEqual(self._count_list_queries(), single)
+
+    def test_project_offer_list_query_count_independent_of_size(self):
+        self.client.force_authenticate(user=self.technician_user)
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get('/api/orders/projectoffers/')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(ctx.captured_queries)
+
+        self._create_orders(1)
+        single = count_queries()
+        self._create_orders(4)
+        self.assertEqual(count_queries(), single)
+
+    def test_cursor_pagination_is_opt_in(self):
+        self._create_orders(3)
+        page = self.client.get('/api/orders/', {'page_size': 2})
+        self.assertEqual(page.data['count'], 3)
+
+        first = self.client.get('/api/orders/', {'paginate': 'cursor', 'page_size': 2})
+        self.assertNotIn('count', first.data)
+        self.assertEqual(len(first.data['results']), 2)
+        self.assertIn('paginate=cursor', first.data['next'])
+        second = self.client.get(first.data['next'])
+        self.assertEqual(len(second.data['results']), 1)
+        ids = [o['order_id'] for o in first.data['results'] + second.data['results']]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+
+    def test_project_offer_list_supports_cursor_pagination(self):
+        self.client.force_authenticate(user=self.technician_user)
+        self._create_orders(3)
+        first = self.client.get('/api/orders/projectoffers/', {'paginate': 'cursor', 'page_size': 2})
+        self.assertNotIn('count', first.data)
+        second = self.client.get(first.data['next'])
+        offer_ids = [offer['offer_id'] for offer in first.data['results'] + second.data['results']]
+        self.assertEqual(offer_ids, sorted(ProjectOffer.objects.values_list('offer_id', flat=True), reverse=True))
+
+
+class WorkerTasksStatusFilterTests(OrderTestCase):
+    service_name = "WorkerTasksService"
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        for order_status in ('ACCEPTED', 'IN_PROGRESS', 'COMPLETED'):
+            create_order(
+                cls.client_user, cls.service, technician_user=cls.technician_user,
+                problem_description=order_status, order_status=order_status,
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.technician_user)
+
+    def _statuses(self, params):
+        response = self.client.get('/api/orders/worker-tasks/', params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(order['order_status'] for order in response.data['results'])
+
+    def test_status_list_is_case_insensitive(self):
+        self.assertEqual(self._statuses({'order_status__in': 'accepted, in_progress'}), ['ACCEPTED', 'IN_PROGRESS'])
+
+    def test_legacy_status_in_parameter(self):
+        self.assertEqual(self._statuses({'status__in': 'COMPLETED'}), ['COMPLETED'])
+
+    def test_unknown_statuses_match_nothing(self):
+        self.assertEqual(self._statuses({'order_status__in': 'bogus'}), [])
+        self.assertEqual(self._statuses({'order_status__in': 'bogus,completed'}), ['COMPLETED'])
+
+    def test_limit_is_capped_at_max_page_size(self):
+        self.assertEqual(len(self._statuses({'limit': '1'})), 1)
+        with mock.patch.object(OrderPagination, 'max_page_size', 2):
+            self.assertEqual(len(self._statuses({'limit': '1000000'})), 2)
+
+    def test_lite_list_returns_plain_rows_with_the_same_filters(self):
+        response = self.client.get('/api/orders/worker-tasks/lite/', {'order_status__in': 'accepted,completed'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = response.data['results']
+        self.assertEqual(sorted(row['order_status'] for row in rows), ['ACCEPTED', 'COMPLETED'])
+        self.assertEqual(set(rows[0]), set(WorkerTasksViewSet.lite_fields))
+        self.assertEqual(rows[0]['service__service_name'], 'WorkerTasksService')
+        self.assertIsNone(rows[0]['review__rating'])
+
+    def test_invalid_limit_is_ignored_and_detail_ignores_limit(self):
+        self.assertEqual(len(self._statuses({'limit': 'abc'})), 3)
+        self.assertEqual(len(self._statuses({'limit': '-1'})), 3)
+        order = Order.objects.filter(technician_user=self.technician_user).order_by('order_id').first()
+        response = self.client.get(f'/api/orders/worker-tasks/{order.order_id}/', {'limit': '1'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
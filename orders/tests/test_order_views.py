@@ -112,7 +112,8 @@ class OrderViewsTest(APITestCase):
             'scheduled_time_start': '09:00',
             'scheduled_time_end': '17:00'
         }
-        response = self.client_api.post(self.order_list_url, data, format='json')
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client_api.post(self.order_list_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Order.objects.count(), 1)
         order = Order.objects.first()
@@ -159,7 +160,8 @@ class OrderViewsTest(APITestCase):
         )
         
         url = f'/api/orders/{order.order_id}/accept-offer/{offer.offer_id}/'
-        response = self.client_api.post(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client_api.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         order.refresh_from_db()
@@ -187,7 +189,9 @@ class OrderViewsTest(APITestCase):
         self.assertTrue(self.technician_user.notifications.filter(notification_type='offer_accepted').exists())
         self.assertTrue(self.client_user.notifications.filter(notification_type='offer_accepted').exists())
 
-        # Verify other offers for this order are rejected
+        # Verify the accepted offer is marked accepted and other offers for this order are rejected
+        offer.refresh_from_db()
+        self.assertEqual(offer.status, 'accepted')
         rejected_offer.refresh_from_db() # Refresh after API call
         self.assertEqual(rejected_offer.status, 'rejected')
         self.assertTrue(self.technician_user_2.notifications.filter(notification_type='offer_rejected').exists())
@@ -278,7 +282,8 @@ class OrderViewsTest(APITestCase):
             final_price=200.00
         )
         url = f'/api/orders/{order.order_id}/mark-job-done/'
-        response = self.technician_api.post(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.technician_api.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         order.refresh_from_db()
@@ -399,7 +404,8 @@ class OrderViewsTest(APITestCase):
         )
         data = {'client_argument': 'Technician left job incomplete.'}
         url = f'/api/orders/{order.order_id}/initiate-dispute/'
-        response = self.client_api.post(url, data, format='json')
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client_api.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         order.refresh_from_db()
@@ -410,6 +416,34 @@ class OrderViewsTest(APITestCase):
         # No transaction is created on dispute initiation
         self.assertFalse(Transaction.objects.filter(order=order, transaction_type='dispute_resolution').exists())
 
+    def test_list_has_dispute_returns_each_disputed_order_once(self):
+        """
+        Ensure ?has_dispute=true lists only disputed orders, once each however many disputes they have.
+        """
+        orders = [
+            Order.objects.create(
+                client_user=self.client_user,
+                technician_user=self.technician_user,
+                service=self.service,
+                order_type='on_demand',
+                problem_description=f'Order {index}',
+                requested_location='Test Location',
+                scheduled_date=(timezone.now() + timedelta(days=1)).date(),
+                scheduled_time_start='09:00',
+                scheduled_time_end='17:00',
+                order_status='DISPUTED',
+                final_price=100.00
+            )
+            for index in range(2)
+        ]
+        disputed_order = orders[0]
+        Dispute.objects.create(order=disputed_order, initiator=self.client_user, client_argument='First')
+        Dispute.objects.create(order=disputed_order, initiator=self.technician_user, technician_argument='Second')
+
+        response = self.client_api.get(self.order_list_url, {'has_dispute': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([order['order_id'] for order in response.data['results']], [disputed_order.order_id])
+
     def test_cancel_order_open(self):
         """
         Ensure client can cancel an open order without funds in escrow.
@@ -427,7 +461,8 @@ class OrderViewsTest(APITestCase):
             final_price=0.00
         )
         url = f'/api/orders/{order.order_id}/cancel-order/'
-        response = self.client_api.post(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client_api.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         order.refresh_from_db()
@@ -460,7 +495,8 @@ class OrderViewsTest(APITestCase):
             final_price=200.00
         )
         url = f'/api/orders/{order.order_id}/cancel-order/'
-        response = self.client_api.post(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client_api.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         order.refresh_from_db()
@@ -502,7 +538,8 @@ class OrderViewsTest(APITestCase):
             final_price=200.00
         )
         url = f'/api/orders/{order.order_id}/cancel-order/'
-        response = self.admin_api.post(url) # Admin cancels
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.admin_api.post(url) # Admin cancels
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         order.refresh_from_db()
@@ -202,6 +202,14 @@ class ProjectOfferTests(APITestCase):
         self.assertEqual(ProjectOffer.objects.count(), 3)
         self.assertEqual(response.data['offered_price'], '150.00')
 
+    def test_technician_create_project_offer_for_other_technician_forbidden(self):
+        client = self.get_auth_client(self.technician_user)
+        new_offer_data = self.project_offer_data.copy()
+        new_offer_data['technician_user'] = self.other_technician_user.user_id
+        response = client.post(self.list_url, new_offer_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(ProjectOffer.objects.count(), 2)
+
     def test_technician_list_own_project_offers(self):
         client = self.get_auth_client(self.technician_user)
         response = client.get(self.list_url)
@@ -267,6 +275,14 @@ class ProjectOfferTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(ProjectOffer.objects.count(), 3)
 
+    def test_admin_create_project_offer_requires_technician(self):
+        client = self.get_auth_client(self.admin_user)
+        new_offer_data = self.project_offer_data.copy()
+        del new_offer_data['technician_user']
+        response = client.post(self.list_url, new_offer_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('technician_user', response.data)
+
     def test_admin_list_all_project_offers(self):
         client = self.get_auth_client(self.admin_user)
         response = client.get(self.list_url)
@@ -0,0 +1,29 @@
+from django.contrib.auth.models import AnonymousUser
+from django.db.models import Q
+
+from orders.rbac import orders_visible_to, project_offers_visible_to
+from orders.tests.factories import OrderTestCase, create_user
+
+
+class VisibilityRuleTests(OrderTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.admin_user = create_user('rbac-admin@example.com', 'admin')
+        cls.support_user = create_user('rbac-support@example.com', 'support')
+
+    def test_orders_visible_to(self):
+        self.assertEqual(orders_visible_to(self.admin_user), Q())
+        self.assertEqual(orders_visible_to(self.admin_user, me=True), Q(client_user=self.admin_user))
+        self.assertEqual(orders_visible_to(self.client_user), Q(client_user=self.client_user))
+        self.assertEqual(orders_visible_to(self.technician_user), Q(client_user=self.technician_user))
+
+    def test_project_offers_visible_to(self):
+        self.assertEqual(project_offers_visible_to(self.admin_user), Q())
+        self.assertEqual(project_offers_visible_to(self.client_user), Q(order__client_user=self.client_user))
+        self.assertEqual(project_offers_visible_to(self.technician_user), Q(technician_user=self.technician_user))
+
+    def test_unknown_role_and_anonymous_see_nothing(self):
+        for user in (self.support_user, AnonymousUser()):
+            self.assertIsNone(orders_visible_to(user))
+            self.assertIsNone(project_offers_visible_to(user))
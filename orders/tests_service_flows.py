@@ -14,6 +14,7 @@ Test coverage includes:
 """
 
 from datetime import date
+from functools import cached_property
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
@@ -30,18 +31,94 @@ from notifications.models import Notification
 User = get_user_model()
 
 
-class BaseTestCase(APITestCase):
-    """Base test case with common setup for all tests."""
-    
-    def setUp(self):
-        """Set up test data."""
+class PermissionBaseTestCase(APITestCase):
+    """
+    Lean base for tests that need users but no orders.
+
+    Only creates the user types plus a client and an unverified technician;
+    no services, orders or offers.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Resolve the parameterless endpoint URLs once per class."""
+        super().setUpClass()
+        cls.URL_ORDER_LIST = reverse('orders:order-list')
+        cls.URL_AVAILABLE = reverse('orders:order-available-for-offer')
+        cls.URL_PROJECTOFFER_LIST = reverse('orders:projectoffer-list')
+        cls.URL_PUBLIC_USER_LIST = reverse('users:public_user-list')
+
+    @staticmethod
+    def offers_url(order_id):
+        return reverse('orders:order-offers', kwargs={'order_id': order_id})
+
+    @staticmethod
+    def accept_offer_url(order_id, offer_id):
+        return reverse('orders:order-accept-offer', kwargs={'order_id': order_id, 'offer_id': offer_id})
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create the shared fixtures once per test class.
+
+        Django wraps each test in a transaction and deep-copies these class
+        attributes on first access, so tests may mutate them freely.
+        """
         # Create user types
-        self.client_user_type = UserType.objects.create(user_type_name='client')
-        self.technician_user_type = UserType.objects.create(user_type_name='technician')
-        self.admin_user_type = UserType.objects.create(user_type_name='admin')
-        
-        # Create test users
-        self.admin_user = User.objects.create_user(
+        cls.client_user_type = UserType.objects.create(user_type_name='client')
+        cls.technician_user_type = UserType.objects.create(user_type_name='technician')
+        cls.admin_user_type = UserType.objects.create(user_type_name='admin')
+
+        cls.client_user = User.objects.create_user(
+            email='client@test.com',
+            password='clientpass',
+            first_name='Client',
+            last_name='User',
+            user_type_name='client',
+            available_balance=1000.00  # Enough to accept either offer into escrow
+        )
+
+        cls.technician_user3 = User.objects.create_user(
+            email='tech3@test.com',
+            password='techpass',
+            first_name='Tech',
+            last_name='Three',
+            user_type_name='technician',
+            verification_status='pending',  # Not verified
+            account_status='active'
+        )
+
+    # API clients are built lazily: each test instance only pays for the
+    # clients it actually uses.
+    @staticmethod
+    def _authenticated_client(user):
+        api_client = APIClient()
+        api_client.force_authenticate(user=user)
+        return api_client
+
+    @cached_property
+    def client_api(self):
+        return self._authenticated_client(self.client_user)
+
+    @cached_property
+    def tech3_client(self):
+        return self._authenticated_client(self.technician_user3)
+
+    @cached_property
+    def anonymous_client(self):
+        return APIClient()
+
+
+class BaseTestCase(PermissionBaseTestCase):
+    """Base test case with common setup for all tests."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Add the verified technicians, services, orders and offers."""
+        super().setUpTestData()
+
+        # Create the remaining test users
+        cls.admin_user = User.objects.create_user(
             email='admin@test.com',
             password='adminpass',
             first_name='Admin',
@@ -51,15 +128,7 @@ class BaseTestCase(APITestCase):
             is_superuser=True
         )
         
-        self.client_user = User.objects.create_user(
-            email='client@test.com',
-            password='clientpass',
-            first_name='Client',
-            last_name='User',
-            user_type_name='client'
-        )
-        
-        self.technician_user1 = User.objects.create_user(
+        cls.technician_user1 = User.objects.create_user(
             email='tech1@test.com',
             password='techpass',
             first_name='Tech',
@@ -72,7 +141,7 @@ class BaseTestCase(APITestCase):
             num_jobs_completed=10
         )
         
-        self.technician_user2 = User.objects.create_user(
+        cls.technician_user2 = User.objects.create_user(
             email='tech2@test.com',
             password='techpass',
             first_name='Tech',
@@ -85,27 +154,17 @@ class BaseTestCase(APITestCase):
             num_jobs_completed=15
         )
         
-        self.technician_user3 = User.objects.create_user(
-            email='tech3@test.com',
-            password='techpass',
-            first_name='Tech',
-            last_name='Three',
-            user_type_name='technician',
-            verification_status='pending',  # Not verified
-            account_status='active'
-        )
-        
         # Create services
-        self.service_category = ServiceCategory.objects.create(category_name='Home Services')
-        self.plumbing_service = Service.objects.create(
-            category=self.service_category,
+        cls.service_category = ServiceCategory.objects.create(category_name='Home Services')
+        cls.plumbing_service = Service.objects.create(
+            category=cls.service_category,
             service_name='Plumbing',
             description='Plumbing services',
             service_type='General',
             base_inspection_fee=50.00
         )
-        self.electrical_service = Service.objects.create(
-            category=self.service_category,
+        cls.electrical_service = Service.objects.create(
+            category=cls.service_category,
             service_name='Electrical',
             description='Electrical services',
             service_type='General',
@@ -113,9 +172,9 @@ class BaseTestCase(APITestCase):
         )
         
         # Create test orders
-        self.available_order = Order.objects.create(
-            service=self.plumbing_service,
-            client_user=self.client_user,
+        cls.available_order = Order.objects.create(
+            service=cls.plumbing_service,
+            client_user=cls.client_user,
             order_type='service_request',
             problem_description='Fix leaky faucet',
             requested_location='123 Main St, Cairo',
@@ -123,12 +182,12 @@ class BaseTestCase(APITestCase):
             scheduled_time_start='10:00',
             scheduled_time_end='12:00',
             creation_timestamp=date(2025, 11, 27),
-            order_status='pending'
+            order_status='OPEN'
         )
         
-        self.assigned_order = Order.objects.create(
-            service=self.electrical_service,
-            client_user=self.client_user,
+        cls.assigned_order = Order.objects.create(
+            service=cls.electrical_service,
+            client_user=cls.client_user,
             order_type='service_request',
             problem_description='Install light fixture',
             requested_location='456 Oak Ave, Alexandria',
@@ -137,45 +196,39 @@ class BaseTestCase(APITestCase):
             scheduled_time_end='16:00',
             creation_timestamp=date(2025, 11, 27),
             order_status='accepted',
-            technician_user=self.technician_user1
+            technician_user=cls.technician_user1
         )
         
         # Create test offers
-        self.offer1 = ProjectOffer.objects.create(
-            order=self.available_order,
-            technician_user=self.technician_user1,
+        cls.offer1 = ProjectOffer.objects.create(
+            order=cls.available_order,
+            technician_user=cls.technician_user1,
             offered_price=150.00,
             offer_description='Professional plumbing service',
             offer_date=date(2025, 11, 27),
             status='pending'
         )
         
-        self.offer2 = ProjectOffer.objects.create(
-            order=self.available_order,
-            technician_user=self.technician_user2,
+        cls.offer2 = ProjectOffer.objects.create(
+            order=cls.available_order,
+            technician_user=cls.technician_user2,
             offered_price=175.00,
             offer_description='Quality electrical work',
             offer_date=date(2025, 11, 27),
             status='pending'
         )
-        
-        # Set up API clients
-        self.admin_client = APIClient()
-        self.admin_client.force_authenticate(user=self.admin_user)
-        
-        self.client_api = APIClient()
-        self.client_api.force_authenticate(user=self.client_user)
-        
-        self.tech1_client = APIClient()
-        self.tech1_client.force_authenticate(user=self.technician_user1)
-        
-        self.tech2_client = APIClient()
-        self.tech2_client.force_authenticate(user=self.technician_user2)
-        
-        self.tech3_client = APIClient()
-        self.tech3_client.force_authenticate(user=self.technician_user3)
-        
-        self.anonymous_client = APIClient()
+
+    @cached_property
+    def admin_client(self):
+        return self._authenticated_client(self.admin_user)
+
+    @cached_property
+    def tech1_client(self):
+        return self._authenticated_client(self.technician_user1)
+
+    @cached_property
+    def tech2_client(self):
+        return self._authenticated_client(self.technician_user2)
 
 
 class OrderAvailableForOfferTests(BaseTestCase):
@@ -183,7 +236,7 @@ class OrderAvailableForOfferTests(BaseTestCase):
     
     def test_technician_can_view_available_orders(self):
         """Test that verified technicians can view available orders."""
-        url = reverse('orders:order-available-for-offer')
+        url = self.URL_AVAILABLE
         response = self.tech1_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -191,27 +244,6 @@ class OrderAvailableForOfferTests(BaseTestCase):
         self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0]['order_id'], self.available_order.order_id)
     
-    def test_unverified_technician_cannot_view_available_orders(self):
-        """Test that unverified technicians cannot view available orders."""
-        url = reverse('orders:order-available-for-offer')
-        response = self.tech3_client.get(url)
-        
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-    
-    def test_client_cannot_view_available_orders(self):
-        """Test that clients cannot access available orders endpoint."""
-        url = reverse('orders:order-available-for-offer')
-        response = self.client_api.get(url)
-        
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-    
-    def test_anonymous_user_cannot_view_available_orders(self):
-        """Test that anonymous users cannot view available orders."""
-        url = reverse('orders:order-available-for-offer')
-        response = self.anonymous_client.get(url)
-        
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-    
     def test_available_orders_filtered_correctly(self):
         """Test that only orders without assigned technicians are returned."""
         # Create another order with assigned technician
@@ -229,7 +261,7 @@ class OrderAvailableForOfferTests(BaseTestCase):
             technician_user=self.technician_user2
         )
         
-        url = reverse('orders:order-available-for-offer')
+        url = self.URL_AVAILABLE
         response = self.tech1_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -237,12 +269,34 @@ class OrderAvailableForOfferTests(BaseTestCase):
         self.assertEqual(response.data['results'][0]['order_id'], self.available_order.order_id)
 
 
+class OrderAvailableForOfferPublicAccessTests(PermissionBaseTestCase):
+    """Test that OrderViewSet.available_for_offer serves the public board to anyone."""
+    
+    def assertPublicBoard(self, response):
+        """The board is public; this fixture has no orders, so it is empty."""
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+        self.assertEqual(response.data['results'], [])
+    
+    def test_unverified_technician_can_view_available_orders(self):
+        """Test that unverified technicians get the public board."""
+        self.assertPublicBoard(self.tech3_client.get(self.URL_AVAILABLE))
+    
+    def test_client_can_view_available_orders(self):
+        """Test that clients get the public board."""
+        self.assertPublicBoard(self.client_api.get(self.URL_AVAILABLE))
+    
+    def test_anonymous_user_can_view_available_orders(self):
+        """Test that anonymous users get the public board."""
+        self.assertPublicBoard(self.anonymous_client.get(self.URL_AVAILABLE))
+
+
 class OrderOffersTests(BaseTestCase):
     """Test OrderViewSet.offers endpoint."""
     
     def test_client_can_view_offers_for_their_order(self):
         """Test that clients can view offers for their orders."""
-        url = reverse('orders:order-offers', kwargs={'pk': self.available_order.pk})
+        url = self.offers_url(self.available_order.pk)
         response = self.client_api.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -255,15 +309,30 @@ class OrderOffersTests(BaseTestCase):
     
     def test_admin_can_view_offers_for_any_order(self):
         """Test that admins can view offers for any order."""
-        url = reverse('orders:order-offers', kwargs={'pk': self.available_order.pk})
+        url = f"{self.offers_url(self.available_order.pk)}?page_size=1"
         response = self.admin_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 2)
+        self.assertEqual(response.data['count'], 2)
+    
+    def test_offers_support_cursor_pagination(self):
+        """Test that cursor pages list offers in the same order as numbered pages."""
+        # The older offer gets the later date, so offer_date and offer_id disagree
+        ProjectOffer.objects.filter(pk=self.offer1.pk).update(offer_date=date(2025, 11, 28))
+        url = self.offers_url(self.available_order.pk)
+        numbered = self.client_api.get(url)
+        first = self.client_api.get(url, {'paginate': 'cursor', 'page_size': 1})
+        
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', first.data)
+        second = self.client_api.get(first.data['next'])
+        ids = [offer['offer_id'] for offer in first.data['results'] + second.data['results']]
+        self.assertEqual(ids, [self.offer1.offer_id, self.offer2.offer_id])
+        self.assertEqual(ids, [offer['offer_id'] for offer in numbered.data['results']])
     
     def test_technician_cannot_view_offers_for_others_orders(self):
         """Test that technicians cannot view offers for orders they don't own."""
-        url = reverse('orders:order-offers', kwargs={'pk': self.available_order.order_id})
+        url = self.offers_url(self.available_order.order_id)
         response = self.tech1_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -282,14 +351,14 @@ class OrderOffersTests(BaseTestCase):
         another_client_api = APIClient()
         another_client_api.force_authenticate(user=another_client_user)
         
-        url = reverse('orders:order-offers', kwargs={'pk': self.available_order.pk})
+        url = self.offers_url(self.available_order.pk)
         response = another_client_api.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
     
     def test_returns_404_for_nonexistent_order(self):
         """Test that 404 is returned for non-existent orders."""
-        url = reverse('orders:order-offers', kwargs={'pk': 99999})
+        url = self.offers_url(99999)
         response = self.client_api.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -298,82 +367,67 @@ class OrderOffersTests(BaseTestCase):
 class OrderAcceptOfferTests(BaseTestCase):
     """Test OrderViewSet.accept_offer endpoint."""
     
-    @patch('orders.views.Notification.objects.create')
-    def test_client_can_accept_offer(self, mock_notification):
+    def test_client_can_accept_offer(self):
         """Test that clients can accept offers for their orders."""
-        url = reverse('orders:order-accept-offer', kwargs={
-            'pk': self.available_order.pk,
-            'offer_id': self.offer1.offer_id
-        })
-        response = self.client_api.post(url)
+        url = self.accept_offer_url(self.available_order.pk, self.offer1.offer_id)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client_api.post(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['message'], 'Offer accepted successfully.')
+        self.assertEqual(response.data['message'], 'Offer accepted and funds moved to escrow successfully.')
         
-        # Refresh from database
-        self.available_order.refresh_from_db()
-        self.offer1.refresh_from_db()
+        # Refresh only the columns under test
+        self.available_order.refresh_from_db(fields=['technician_user', 'order_status'])
+        self.offer1.refresh_from_db(fields=['status'])
         
         # Check that order was assigned to technician
         self.assertEqual(self.available_order.technician_user, self.technician_user1)
-        self.assertEqual(self.available_order.order_status, 'accepted')
+        self.assertEqual(self.available_order.order_status, 'ACCEPTED')
         
         # Check that offer status was updated
         self.assertEqual(self.offer1.status, 'accepted')
         
         # Check that other offers were rejected
-        self.offer2.refresh_from_db()
+        self.offer2.refresh_from_db(fields=['status'])
         self.assertEqual(self.offer2.status, 'rejected')
         
-        # Check that notifications were sent
-        self.assertTrue(mock_notification.called)
-        self.assertEqual(mock_notification.call_count, 3)  # To accepted tech, rejected tech, client
+        # Check that notifications were written once the acceptance committed
+        self.assertEqual(
+            Notification.objects.filter(related_order=self.available_order).count(), 3
+        )  # To accepted tech, rejected tech, client
     
-    @patch('orders.views.Notification.objects.create')
-    def test_admin_can_accept_offer_for_any_order(self, mock_notification):
+    def test_admin_can_accept_offer_for_any_order(self):
         """Test that admins can accept offers for any order."""
-        url = reverse('orders:order-accept-offer', kwargs={
-            'pk': self.available_order.pk,
-            'offer_id': self.offer2.offer_id
-        })
+        url = self.accept_offer_url(self.available_order.pk, self.offer2.offer_id)
         response = self.admin_client.post(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        # Refresh from database
-        self.available_order.refresh_from_db()
-        self.offer2.refresh_from_db()
+        # Refresh only the columns under test
+        self.available_order.refresh_from_db(fields=['technician_user'])
+        self.offer2.refresh_from_db(fields=['status'])
         
         # Check that order was assigned to the accepted offer's technician
         self.assertEqual(self.available_order.technician_user, self.technician_user2)
         self.assertEqual(self.offer2.status, 'accepted')
     
     def test_technician_cannot_accept_offers(self):
-        """Test that technicians cannot accept offers."""
-        url = reverse('orders:order-accept-offer', kwargs={
-            'pk': self.available_order.pk,
-            'offer_id': self.offer1.offer_id
-        })
+        """Test that technicians cannot accept offers on orders they don't own."""
+        url = self.accept_offer_url(self.available_order.pk, self.offer1.offer_id)
         response = self.tech1_client.post(url)
         
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
     
     def test_returns_404_for_nonexistent_order(self):
         """Test that 404 is returned for non-existent orders."""
-        url = reverse('orders:order-accept-offer', kwargs={
-            'pk': 99999,
-            'offer_id': self.offer1.offer_id
-        })
+        url = self.accept_offer_url(99999, self.offer1.offer_id)
         response = self.client_api.post(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
     
     def test_returns_404_for_nonexistent_offer(self):
         """Test that 404 is returned for offers that don't belong to the order."""
-        url = reverse('orders:order-accept-offer', kwargs={
-            'pk': self.available_order.pk,
-            'offer_id': 99999
-        })
+        url = self.accept_offer_url(self.available_order.pk, 99999)
         response = self.client_api.post(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -384,7 +438,7 @@ class UserTechniciansBrowseTests(BaseTestCase):
     
     def test_public_can_view_verified_technicians(self):
         """Test that anyone can browse verified technicians."""
-        url = reverse('users:public_user-list')
+        url = self.URL_PUBLIC_USER_LIST
         response = self.anonymous_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -398,7 +452,7 @@ class UserTechniciansBrowseTests(BaseTestCase):
     
     def test_technicians_sorted_by_rating(self):
         """Test that technicians are sorted by rating and job completion count."""
-        url = reverse('users:public_user-list')
+        url = self.URL_PUBLIC_USER_LIST
         response = self.anonymous_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -410,7 +464,7 @@ class UserTechniciansBrowseTests(BaseTestCase):
     
     def test_filter_by_specialization(self):
         """Test filtering technicians by specialization."""
-        url = f"{reverse('users:public_user-list')}?specialization=Plumbing"
+        url = f"{self.URL_PUBLIC_USER_LIST}?specialization=Plumbing"
         response = self.anonymous_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -426,7 +480,7 @@ class UserTechniciansBrowseTests(BaseTestCase):
         self.technician_user2.address = "Alexandria, Egypt"
         self.technician_user2.save()
         
-        url = f"{reverse('users:public_user-list')}?location=Cairo"
+        url = f"{self.URL_PUBLIC_USER_LIST}?location=Cairo"
         response = self.anonymous_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -435,7 +489,7 @@ class UserTechniciansBrowseTests(BaseTestCase):
     
     def test_filter_by_minimum_rating(self):
         """Test filtering technicians by minimum rating."""
-        url = f"{reverse('users:public_user-list')}?min_rating=4.3"
+        url = f"{self.URL_PUBLIC_USER_LIST}?min_rating=4.3"
         response = self.anonymous_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -444,19 +498,19 @@ class UserTechniciansBrowseTests(BaseTestCase):
     
     def test_invalid_rating_filter_ignored(self):
         """Test that invalid rating filters are ignored."""
-        url = f"{reverse('users:public_user-list')}?min_rating=invalid"
+        url = f"{self.URL_PUBLIC_USER_LIST}?min_rating=invalid&page_size=1"
         response = self.anonymous_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 2)  # All technicians returned
+        self.assertEqual(response.data['count'], 2)  # All technicians returned
     
     def test_authenticated_user_can_browse_technicians(self):
         """Test that authenticated users can also browse technicians."""
-        url = reverse('users:public_user-list')
+        url = f"{self.URL_PUBLIC_USER_LIST}?page_size=1"
         response = self.client_api.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 2)
+        self.assertEqual(response.data['count'], 2)
 
 
 class UserTechnicianDetailTests(BaseTestCase):
@@ -514,29 +568,16 @@ class ProjectOfferCreateTests(BaseTestCase):
             order_status='pending'
         )
         
-        url = reverse('orders:projectoffer-list')
+        url = self.URL_PROJECTOFFER_LIST
         data = {
             'order': new_order.order_id,
             'offered_price': 200.00,
             'offer_description': 'Expert plumbing service with warranty'
         }
-        
-        # Debug output to see what's happening
-        print(f"DEBUG: Attempting to create offer with data: {data}")
-        print(f"DEBUG: Technician user: {self.technician_user1.email}")
-        print(f"DEBUG: Order exists: {new_order.order_id}")
-        
         response = self.tech1_client.post(url, data)
-        
-        print(f"DEBUG: Response status: {response.status_code}")
-        print(f"DEBUG: Response content: {response.content.decode()}")
-        
-        # Instead of asserting immediately, let's see what the error is
-        if response.status_code != status.HTTP_201_CREATED:
-            print(f"DEBUG: Full response data: {response.data}")
-            print(f"DEBUG: Response headers: {response.headers}")
-            
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # The response body is only rendered into the message if the assertion fails
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, msg=response.content)
         self.assertEqual(float(response.data['offered_price']), 200.00)
         
         # Check that notification was sent to client
@@ -550,7 +591,7 @@ class ProjectOfferCreateTests(BaseTestCase):
     
     def test_technician_cannot_create_offer_for_another_technician(self):
         """Test that technicians cannot create offers for other technicians."""
-        url = reverse('orders:projectoffer-list')
+        url = self.URL_PROJECTOFFER_LIST
         data = {
             'order': self.available_order.order_id,
             'technician_user': self.technician_user2.user_id,  # Different technician
@@ -563,7 +604,7 @@ class ProjectOfferCreateTests(BaseTestCase):
     
     def test_client_cannot_create_offers(self):
         """Test that clients cannot create project offers."""
-        url = reverse('orders:projectoffer-list')
+        url = self.URL_PROJECTOFFER_LIST
         data = {
             'order': self.available_order.order_id,
             'offered_price': 150.00,
@@ -593,7 +634,7 @@ class NotificationTests(BaseTestCase):
             order_status='pending'
         )
         
-        url = reverse('orders:projectoffer-list')
+        url = self.URL_PROJECTOFFER_LIST
         data = {
             'order': new_order.order_id,
             'offered_price': 100.00,
@@ -604,49 +645,49 @@ class NotificationTests(BaseTestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         mock_create_notification.assert_called_once()
     
-    @patch('notifications.utils.create_notification')
-    def test_notifications_sent_when_offer_accepted(self, mock_create_notification):
-        """Test that proper notifications are sent when offers are accepted."""
-        url = reverse('orders:order-accept-offer', kwargs={
-            'order_id': self.available_order.order_id,
-            'offer_id': self.offer1.offer_id
-        })
-        response = self.client_api.post(url)
+    def test_notifications_sent_when_offer_accepted(self):
+        """Test that proper notifications are sent once the offer acceptance commits."""
+        url = self.accept_offer_url(self.available_order.order_id, self.offer1.offer_id)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client_api.post(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Should have sent 3 notifications (to accepted tech, rejected tech, client)
-        self.assertEqual(mock_create_notification.call_count, 3)
-        
-        # Check the calls
-        calls = mock_create_notification.call_args_list
-        
-        # First call - to accepted technician
-        self.assertEqual(calls[0][1]['user'], self.technician_user1)
-        self.assertEqual(calls[0][1]['notification_type'], 'offer_accepted')
-        
-        # Second call - to rejected technician
-        self.assertEqual(calls[1][1]['user'], self.technician_user2)
-        self.assertEqual(calls[1][1]['notification_type'], 'offer_rejected')
-        
-        # Third call - to client
-        self.assertEqual(calls[2][1]['user'], self.client_user)
-        self.assertEqual(calls[2][1]['notification_type'], 'offer_accepted')
+        notifications = Notification.objects.filter(related_order=self.available_order)
+        self.assertEqual(
+            sorted(notifications.values_list('user_id', 'notification_type')),
+            sorted([
+                (self.technician_user1.pk, 'offer_accepted'),
+                (self.technician_user2.pk, 'offer_rejected'),
+                (self.client_user.pk, 'offer_accepted'),
+            ])
+        )
 
 
-class EdgeCaseTests(BaseTestCase):
-    """Test edge cases and error handling."""
-    
+class EmptyOrderBoardTests(PermissionBaseTestCase):
+    """Test available_for_offer against a database that never had any orders."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.technician_user1 = TestDataFactory.create_technician_user(email='tech1@test.com')
+
+    @cached_property
+    def tech1_client(self):
+        return self._authenticated_client(self.technician_user1)
+
     def test_available_for_offer_with_no_available_orders(self):
         """Test available_for_offer when no orders are available."""
-        # Delete all available orders
-        Order.objects.all().delete()
-        
-        url = reverse('orders:order-available-for-offer')
+        url = f"{self.URL_AVAILABLE}?page_size=1"
         response = self.tech1_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 0)
+        self.assertEqual(response.data['count'], 0)
+
+
+class EdgeCaseTests(BaseTestCase):
+    """Test edge cases and error handling."""
     
     def test_offers_endpoint_with_no_offers(self):
         """Test offers endpoint when order has no offers."""
@@ -664,11 +705,11 @@ class EdgeCaseTests(BaseTestCase):
             order_status='pending'
         )
         
-        url = reverse('orders:order-offers', kwargs={'pk': empty_order.pk})
+        url = f"{self.offers_url(empty_order.pk)}?page_size=1"
         response = self.client_api.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 0)
+        self.assertEqual(response.data['count'], 0)
     
     def test_browse_technicians_with_no_verified_technicians(self):
         """Test browsing technicians when no verified technicians exist."""
@@ -678,26 +719,22 @@ class EdgeCaseTests(BaseTestCase):
         self.technician_user2.verification_status = 'rejected'
         self.technician_user2.save()
         
-        url = reverse('users:public_user-list')
+        url = f"{self.URL_PUBLIC_USER_LIST}?page_size=1"
         response = self.anonymous_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 0)
+        self.assertEqual(response.data['count'], 0)
     
     def test_accept_already_accepted_offer(self):
-        """Test accepting an offer that is already accepted."""
+        """Test that an offer cannot be accepted twice."""
         # First accept the offer
-        url = reverse('orders:order-accept-offer', kwargs={
-            'pk': self.available_order.pk,
-            'offer_id': self.offer1.offer_id
-        })
-        self.client_api.post(url)
+        url = self.accept_offer_url(self.available_order.pk, self.offer1.offer_id)
+        self.assertEqual(self.client_api.post(url).status_code, status.HTTP_200_OK)
         
-        # Now try to accept it again
+        # Now try to accept it again: the order is no longer open
         response = self.client_api.post(url)
         
-        self.assertEqual(response.status_code, status.HTTP_200_OK)  # Should still work
-        self.assertEqual(response.data['message'], 'Offer accepted successfully.')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
 class PermissionIntegrationTests(BaseTestCase):
@@ -706,15 +743,15 @@ class PermissionIntegrationTests(BaseTestCase):
     def test_all_endpoints_require_authentication_except_public_technician_browse(self):
         """Test that only technician browsing is publicly accessible."""
         # Test order list - should require auth
-        response = self.anonymous_client.get(reverse('orders:order-list'))
+        response = self.anonymous_client.get(self.URL_ORDER_LIST)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         
         # Test project offers list - should require auth
-        response = self.anonymous_client.get(reverse('orders:projectoffer-list'))
+        response = self.anonymous_client.get(self.URL_PROJECTOFFER_LIST)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         
         # Test technicians browse - should be public
-        response = self.anonymous_client.get(reverse('users:public_user-list'))
+        response = self.anonymous_client.get(self.URL_PUBLIC_USER_LIST)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Test technician detail - should be public
@@ -725,20 +762,17 @@ class PermissionIntegrationTests(BaseTestCase):
     def test_cross_role_access_restrictions(self):
         """Test that users cannot access other roles' data."""
         # Client tries to access available orders
-        url = reverse('orders:order-available-for-offer')
+        url = self.URL_AVAILABLE
         response = self.client_api.get(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
         # Technician tries to view offers for someone else's order
-        url = reverse('orders:order-offers', kwargs={'pk': self.available_order.pk})
+        url = self.offers_url(self.available_order.pk)
         response = self.tech1_client.get(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
         # Technician tries to accept offers
-        url = reverse('orders:order-accept-offer', kwargs={
-            'pk': self.available_order.pk,
-            'offer_id': self.offer1.offer_id
-        })
+        url = self.accept_offer_url(self.available_order.pk, self.offer1.offer_id)
         response = self.tech1_client.post(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
@@ -760,7 +794,8 @@ class ClientMakeOfferToTechnicianTests(BaseTestCase):
             'scheduled_time_end': '13:00',
             'offer_description': 'My direct offer for pipe repair.'
         }
-        response = self.client_api.post(url, data, format='json')
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client_api.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn('message', response.data)
@@ -842,53 +877,57 @@ class ClientMakeOfferToTechnicianTests(BaseTestCase):
 class TechnicianRespondToClientOfferTests(BaseTestCase):
     """Test UserViewSet.respond_to_client_offer endpoint."""
 
-    def setUp(self):
-        super().setUp()
-        # Create an order and a client-initiated offer for technician1
-        self.client_offer_order = Order.objects.create(
-            service=self.plumbing_service,
-            client_user=self.client_user,
-            order_type='direct_hire',
-            problem_description='Client-initiated job',
-            requested_location='Client Offer Location',
-            scheduled_date=date(2026, 1, 1),
-            scheduled_time_start='10:00',
-            scheduled_time_end='12:00',
-            creation_timestamp=date(2025, 11, 28),
-            order_status='awaiting_technician_response'
-        )
-        self.client_offer_to_tech1 = ProjectOffer.objects.create(
-            order=self.client_offer_order,
-            technician_user=self.technician_user1,
-            offered_price=300.00,
-            offer_description='Client offers this much.',
-            offer_date=date(2025, 11, 28),
-            status='pending',
-            offer_initiator='client'
-        )
-        
-        # Create another client-initiated offer for technician2, which will be rejected
-        self.client_offer_to_tech2_order = Order.objects.create(
-            service=self.electrical_service,
-            client_user=self.client_user,
-            order_type='direct_hire',
-            problem_description='Client-initiated electrical job',
-            requested_location='Another Client Offer Location',
-            scheduled_date=date(2026, 1, 2),
-            scheduled_time_start='14:00',
-            scheduled_time_end='16:00',
-            creation_timestamp=date(2025, 11, 28),
-            order_status='awaiting_technician_response'
-        )
-        self.client_offer_to_tech2 = ProjectOffer.objects.create(
-            order=self.client_offer_to_tech2_order,
-            technician_user=self.technician_user2,
-            offered_price=400.00,
-            offer_description='Client offers for electrical.',
-            offer_date=date(2025, 11, 28),
-            status='pending',
-            offer_initiator='client'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Two direct-hire orders, each with a pending client-initiated offer:
+        # one for technician1 and one for technician2 (which will be rejected)
+        cls.client_offer_order, cls.client_offer_to_tech2_order = TestDataFactory.bulk_create_orders([
+            dict(
+                service=cls.plumbing_service,
+                client_user=cls.client_user,
+                order_type='direct_hire',
+                problem_description='Client-initiated job',
+                requested_location='Client Offer Location',
+                scheduled_date=date(2026, 1, 1),
+                scheduled_time_start='10:00',
+                scheduled_time_end='12:00',
+                creation_timestamp=date(2025, 11, 28),
+                order_status='awaiting_technician_response'
+            ),
+            dict(
+                service=cls.electrical_service,
+                client_user=cls.client_user,
+                order_type='direct_hire',
+                problem_description='Client-initiated electrical job',
+                requested_location='Another Client Offer Location',
+                scheduled_date=date(2026, 1, 2),
+                scheduled_time_start='14:00',
+                scheduled_time_end='16:00',
+                creation_timestamp=date(2025, 11, 28),
+                order_status='awaiting_technician_response'
+            ),
+        ])
+        cls.client_offer_to_tech1, cls.client_offer_to_tech2 = ProjectOffer.objects.bulk_create([
+            ProjectOffer(
+                order=cls.client_offer_order,
+                technician_user=cls.technician_user1,
+                offered_price=300.00,
+                offer_description='Client offers this much.',
+                offer_date=date(2025, 11, 28),
+                status='pending',
+                offer_initiator='client'
+            ),
+            ProjectOffer(
+                order=cls.client_offer_to_tech2_order,
+                technician_user=cls.technician_user2,
+                offered_price=400.00,
+                offer_description='Client offers for electrical.',
+                offer_date=date(2025, 11, 28),
+                status='pending',
+                offer_initiator='client'
+            ),
+        ])
 
     @patch('users.views.user_views.Notification.objects.create')
     def test_technician_can_accept_client_offer(self, mock_notification):
@@ -898,7 +937,8 @@ class TechnicianRespondToClientOfferTests(BaseTestCase):
             'offer_id': self.client_offer_to_tech1.offer_id
         })
         data = {'action': 'accept'}
-        response = self.tech1_client.post(url, data, format='json')
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.tech1_client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('message', response.data)
@@ -907,8 +947,8 @@ class TechnicianRespondToClientOfferTests(BaseTestCase):
         self.assertIn('order_status', response.data)
         self.assertEqual(response.data['order_status'], 'accepted')
 
-        self.client_offer_order.refresh_from_db()
-        self.client_offer_to_tech1.refresh_from_db()
+        self.client_offer_order.refresh_from_db(fields=['technician_user', 'order_status'])
+        self.client_offer_to_tech1.refresh_from_db(fields=['status'])
 
         self.assertEqual(self.client_offer_order.technician_user, self.technician_user1)
         self.assertEqual(self.client_offer_order.order_status, 'accepted')
@@ -932,7 +972,8 @@ class TechnicianRespondToClientOfferTests(BaseTestCase):
             'offer_id': self.client_offer_to_tech2.offer_id
         })
         data = {'action': 'reject', 'rejection_reason': 'Not available on that date.'}
-        response = self.tech2_client.post(url, data, format='json')
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.tech2_client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('message', response.data)
@@ -1060,6 +1101,11 @@ class TestDataFactory:
             order_status=status
         )
     
+    @staticmethod
+    def bulk_create_orders(specs):
+        """Create several orders in one INSERT; each spec is a dict of Order field values."""
+        return Order.objects.bulk_create([Order(**spec) for spec in specs])
+    
     @staticmethod
     def create_offer(order, technician, price=100.00):
         """Create a test project offer."""
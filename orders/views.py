@@ -1,27 +1,115 @@
-from rest_framework import viewsets, permissions, serializers, status
+from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.db import transaction as db_transaction # Import for atomic operations
 from django.db import models
+from django.http import Http404
+from django.utils import timezone
 from .models import Order, ProjectOffer
 from rest_framework.exceptions import PermissionDenied, NotFound, ValidationError
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.renderers import JSONRenderer
 from .serializers import OrderSerializer, ProjectOfferSerializer, ProjectOfferDetailSerializer, PublicOrderSerializer, ProjectOfferWithOrderSerializer
 from api.permissions import IsAdminUser, IsClientUser, IsTechnicianUser, IsClientOwnerOrAdmin, IsTechnicianOwnerOrAdmin
-from api.mixins import OwnerFilteredQuerysetMixin
+from api.utils import get_user_role
+from .rbac import orders_visible_to, project_offers_visible_to
+from .cache import cached_list_response, get_admin_ids
 from notifications.models import Notification # Keep this for now, will replace usage with utils
-from notifications.utils import create_notification # Import the helper function
+from notifications.utils import create_notification, create_notification_on_commit, create_notifications_bulk_on_commit, save_notifications_on_commit # Import the helper functions
 from notifications.arabic_translations import ARABIC_NOTIFICATIONS
 from users.models import User # Needed for notifying all technicians and for balance updates
 from transactions.models import Transaction # Import Transaction model for escrow operations
 from disputes.models import Dispute # Import Dispute model
-from datetime import date, datetime, timedelta # Import datetime and timedelta for auto-release
+from datetime import date, timedelta # Import timedelta for auto-release
 from decimal import Decimal # Import Decimal
+from functools import partial
+
+ORDER_STATUSES = frozenset(value for value, _ in Order.ORDER_STATUS_CHOICES)
+
+# Orders with at least one dispute, as a semi-join: unlike filtering on
+# disputes__isnull=False it yields each order once, so no DISTINCT is needed
+HAS_DISPUTE = models.Exists(Dispute.objects.filter(order=models.OuterRef('pk')))
+
+# Re-read a row and hold a lock on it until the transaction ends, e.g.
+# order.refresh_from_db(from_queryset=LOCKED_ORDERS). NO KEY UPDATE is the weakest
+# lock that blocks concurrent writers; rows referencing the order (offers,
+# transactions, notifications) can still be inserted meanwhile.
+LOCKED_ORDERS = Order.objects.select_for_update(no_key=True)
+LOCKED_USERS = User.objects.select_for_update(no_key=True)
+
+def lock_users(*user_ids):
+    """
+    Lock the given users' rows in primary key order. Every flow that writes more than
+    one balance takes the order lock first and then its users through here, so two
+    flows over the same users always queue instead of deadlocking.
+    """
+    list(LOCKED_USERS.filter(pk__in=user_ids).order_by('pk').values_list('pk', flat=True))
+
+def parse_order_statuses(raw):
+    """
+    Parse a comma-separated status list (e.g. "accepted,in_progress") into known
+    Order statuses, case-insensitively. Unknown values are dropped. The result is a
+    sorted tuple, so the same set of statuses always produces the same IN clause.
+    """
+    statuses = {value.strip().upper() for value in raw.split(',')}
+    return tuple(sorted(statuses & ORDER_STATUSES))
+
+def is_order_party_or_admin(order, user):
+    """
+    Whether user is the order's client, its assigned technician (acting as a technician)
+    or an admin. Compares foreign key ids, so no user row is fetched, and reads the
+    role once.
+    """
+    if order.client_user_id == user.pk:
+        return True
+    role = user.role_name
+    return role == 'admin' or (role == 'technician' and order.technician_user_id == user.pk)
+
+class OrderCursorPagination(CursorPagination):
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-order_id' # Unique and indexed (primary key), follows creation order
 
 class OrderPagination(PageNumberPagination):
+    """
+    Page-number pagination by default. Clients that page deep into long lists can opt
+    into cursor (keyset) pagination with ?paginate=cursor; its next/previous links keep
+    that parameter. Cursor pages cost the same at any depth but carry no total count.
+    """
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
+    cursor_pagination_class = OrderCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        # A sliced queryset (WorkerTasks ?limit=) cannot be re-ordered for a cursor
+        if request.query_params.get('paginate') == 'cursor' and not queryset.query.is_sliced:
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if getattr(self, 'cursor_paginator', None) is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+class ProjectOfferCursorPagination(OrderCursorPagination):
+    page_size = 20
+    ordering = '-offer_id'
+
+class ProjectOfferPagination(OrderPagination):
+    """OrderPagination for offers: the project-wide page size of 20, cursor mode on offer_id."""
+    page_size = 20
+    cursor_pagination_class = ProjectOfferCursorPagination
+
+class OrderOfferCursorPagination(ProjectOfferCursorPagination):
+    ordering = ('-offer_date', '-offer_id') # Same order as the offers action's numbered pages
+
+class OrderOfferPagination(ProjectOfferPagination):
+    """ProjectOfferPagination for one order's offers, newest offer date first in both modes."""
+    cursor_pagination_class = OrderOfferCursorPagination
 
 class OrderViewSet(viewsets.ModelViewSet):
     """
@@ -29,8 +117,11 @@ class OrderViewSet(viewsets.ModelViewSet):
 
     list:
     Return a list of orders for the authenticated user (client or technician) or all orders for admin.
+    Pages are numbered (?page=) by default; ?paginate=cursor switches to cursor pages that cost
+    the same at any depth, followed through the next/previous links (no total count).
     Permissions: Authenticated User (client/technician owner) or Admin User.
     Usage: GET /api/orders/
+    Usage: GET /api/orders/?paginate=cursor&page_size=50
 
     retrieve:
     Return a specific order by ID.
@@ -66,7 +157,8 @@ class OrderViewSet(viewsets.ModelViewSet):
     Usage: GET /api/orders/available-for-offer/
 
     offers:
-    Return a list of project offers for a specific order.
+    Return a list of project offers for a specific order, newest offer date first, 20 per page;
+    supports ?paginate=cursor like list, in the same order.
     Permissions: Authenticated Client User (owner of order) or Admin User.
     Usage: GET /api/orders/{order_id}/offers/
 
@@ -76,94 +168,143 @@ class OrderViewSet(viewsets.ModelViewSet):
     Usage: POST /api/orders/{order_id}/accept-offer/{offer_id}/
     """
     pagination_class = OrderPagination
-    # Optimized queryset for common relations
-    queryset = Order.objects.select_related(
-        'client_user', 
+    # User columns PublicUserSerializer renders; the rest of the row (password, email,
+    # phone, balances, technician profile) is never shown for a nested user
+    public_user_fields = (
+        'user_id', 'user_type', 'first_name', 'last_name', 'username', 'bio', 'profile_photo',
+        'specialization', 'overall_rating', 'num_jobs_completed', 'average_response_time',
+        'address', 'registration_date', 'account_status', 'verification_status', 'access_level',
+    )
+    # Every ProjectOffer column (associated_offer reads offer_initiator, and the order
+    # FK is what the prefetch matches offers back to their order on) plus the public
+    # columns of the technician, for ProjectOfferDetailSerializer
+    offer_detail_only_fields = (
+        'offer_id', 'order', 'technician_user', 'offered_price', 'offer_description',
+        'offer_date', 'status', 'offer_initiator',
+    ) + tuple(f'technician_user__{field}' for field in public_user_fields)
+    # Relations rendered by OrderSerializer (client/service nested, offers with their
+    # technicians, disputes); get_queryset applies them so every action gets them.
+    select_related_fields = (
         'client_user__user_type',
-        'technician_user', 
         'technician_user__user_type',
-        'service'
-    ).annotate(
-        review_rating=models.F('review__rating'),
-        review_comment=models.F('review__comment')
-    ).prefetch_related(
-        'project_offers',
-        'project_offers__technician_user',
-        'project_offers__technician_user__user_type',
-        'disputes'
-        # Remove 'review' from prefetch_related as we're using annotations
-    ).order_by('-order_id')
+        'service__category',
+        'review', # One-to-one, rendered as review_rating/review_comment
+    )
+    # OrderSerializer renders technician_user as its id alone, read from the FK column;
+    # only the detail actions use the technician instance, so lists skip that join
+    list_select_related_fields = tuple(
+        field for field in select_related_fields if not field.startswith('technician_user')
+    )
+    prefetch_related_fields = (
+        'client_user__received_reviews',
+        # One query for the offers joined to their technicians and user types, instead
+        # of one each for offers, technicians and user types
+        models.Prefetch(
+            'project_offers',
+            queryset=ProjectOffer.objects.select_related('technician_user__user_type').only(*offer_detail_only_fields),
+        ),
+        'project_offers__technician_user__received_reviews',
+        'disputes',
+    )
+    # Base querysets, built once at import; get_queryset clones one with .all() and
+    # only adds the per-request filters. accept_offer uses the one without prefetches.
+    queryset = Order.objects.select_related(*select_related_fields).order_by('-order_id')
+    prefetched_queryset = queryset.prefetch_related(*prefetch_related_fields)
+    # public_detail renders the order with PublicOrderSerializer (client and service
+    # only) and queries the offers itself, so it skips the review join and the offer
+    # and dispute prefetches
+    public_detail_queryset = Order.objects.with_public_detail()
+    # Columns OrderSerializer renders; the list skips the pricing breakdown,
+    # job timestamps and proposal fields that only detail views need, and loads
+    # only the public columns of the nested client_user
+    list_only_fields = (
+        'order_id', 'service', 'client_user', 'technician_user', 'problem_description',
+        'requested_location', 'scheduled_date', 'scheduled_time_start', 'scheduled_time_end',
+        'order_type', 'creation_timestamp', 'order_status', 'final_price', 'expected_price',
+    ) + tuple(f'client_user__{field}' for field in public_user_fields) + ('review__rating', 'review__comment')
     serializer_class = OrderSerializer
     lookup_field = 'order_id'
+    # JSON only: the browsable API renderer builds a full HTML page (with forms) for
+    # every browser request to these high-traffic endpoints
+    renderer_classes = [JSONRenderer]
+
+    # Permission classes per action, composed once at import rather than on every request
+    _OWNER_OR_ADMIN = IsAdminUser | IsClientOwnerOrAdmin | IsTechnicianOwnerOrAdmin
+    _PERMISSIONS_BY_ACTION = {
+        'create': [permissions.IsAuthenticated], # Allow any authenticated user to create
+        # Any authenticated user may list; get_queryset limits the rows (see orders.rbac).
+        # Technicians only see orders they placed themselves, their jobs are under worker-tasks
+        'list': [permissions.IsAuthenticated, _OWNER_OR_ADMIN],
+        'retrieve': [permissions.IsAuthenticated, _OWNER_OR_ADMIN],
+        'update': [permissions.IsAuthenticated, _OWNER_OR_ADMIN],
+        'partial_update': [permissions.IsAuthenticated, _OWNER_OR_ADMIN],
+        'destroy': [permissions.IsAuthenticated, _OWNER_OR_ADMIN],
+        'available_for_offer': [permissions.AllowAny], # Public access
+        'public_detail': [permissions.AllowAny],
+        # Actions primarily for the client owner or admin
+        'accept_offer': [IsAdminUser | IsClientOwnerOrAdmin],
+        'decline_offer': [IsAdminUser | IsClientOwnerOrAdmin],
+        'release_funds': [IsAdminUser | IsClientOwnerOrAdmin],
+        'cancel_order': [IsAdminUser | IsClientOwnerOrAdmin],
+        # Client owner, assigned technician or admin may initiate a dispute or view offers
+        'initiate_dispute': [_OWNER_OR_ADMIN],
+        'offers': [_OWNER_OR_ADMIN],
+        # Actions strictly for the assigned technician or admin
+        'mark_job_done': [IsAdminUser | IsTechnicianOwnerOrAdmin],
+        'start_job': [IsAdminUser | IsTechnicianOwnerOrAdmin],
+    }
+    # Fallback for any other action
+    _DEFAULT_PERMISSIONS = [permissions.IsAuthenticated, IsAdminUser | IsClientUser | IsTechnicianUser]
+
+    # Actions that see every open, unassigned order
+    _PUBLIC_ACTIONS = frozenset({'available_for_offer', 'public_detail'})
+    # Custom per-order actions routed without detail=True (see orders/urls.py); like
+    # retrieve/update they look up one order and leave access to the permissions
+    _OBJECT_ACTIONS = frozenset({
+        'accept_offer', 'decline_offer', 'mark_job_done', 'release_funds',
+        'initiate_dispute', 'cancel_order', 'offers', 'start_job',
+    })
 
     def get_permissions(self):
-        if self.action == 'create':
-            self.permission_classes = [permissions.IsAuthenticated] # Allow any authenticated user to create
-        elif self.action == 'list':
-            # For list, only allow clients and admins. Technicians should not see generic order list
-            self.permission_classes = [permissions.IsAuthenticated, IsAdminUser | IsClientOwnerOrAdmin | IsTechnicianOwnerOrAdmin]
-        elif self.action in ['update', 'partial_update', 'destroy']:
-            self.permission_classes = [permissions.IsAuthenticated, IsAdminUser | IsClientOwnerOrAdmin | IsTechnicianOwnerOrAdmin]
-        elif self.action == 'available_for_offer':
-            # Changed to AllowAny for public access
-            self.permission_classes = [permissions.AllowAny] 
-        elif self.action == 'public_detail':
-            self.permission_classes = [permissions.AllowAny]
-        elif self.action in ['accept_offer', 'decline_offer', 'release_funds', 'cancel_order']:
-            # Actions primarily for the client owner or admin
-            self.permission_classes = [IsAdminUser | IsClientOwnerOrAdmin]
-        elif self.action == 'initiate_dispute':
-            # Allow client owner or assigned technician or admin to initiate dispute
-            self.permission_classes = [IsAdminUser | IsClientOwnerOrAdmin | IsTechnicianOwnerOrAdmin]
-        elif self.action == 'offers':
-            # Offers can be viewed by client owner, assigned technician, or admin
-            self.permission_classes = [IsAdminUser | IsClientOwnerOrAdmin | IsTechnicianOwnerOrAdmin]
-        elif self.action == 'mark_job_done' or self.action == 'start_job': # Added start_job
-            # Action strictly for the assigned technician or admin
-            self.permission_classes = [IsAdminUser | IsTechnicianOwnerOrAdmin]
-        elif self.action == 'retrieve': # Explicitly handle retrieve
-             self.permission_classes = [permissions.IsAuthenticated, IsAdminUser | IsClientOwnerOrAdmin | IsTechnicianOwnerOrAdmin]
-        else: # Fallback for any other action
-            self.permission_classes = [permissions.IsAuthenticated, IsAdminUser | IsClientUser | IsTechnicianUser]
+        self.permission_classes = self._PERMISSIONS_BY_ACTION.get(self.action, self._DEFAULT_PERMISSIONS)
         return [permission() for permission in self.permission_classes]
 
+    def list(self, request, *args, **kwargs):
+        return cached_list_response('orders', request, partial(super().list, request, *args, **kwargs))
+
     def get_queryset(self):
         user = self.request.user
-        base_queryset = Order.objects.select_related(
-            'client_user', 
-            'client_user__user_type',
-            'technician_user', 
-            'technician_user__user_type',
-            'service'
-        ).annotate(
-            review_rating=models.F('review__rating'),
-            review_comment=models.F('review__comment')
-        ).prefetch_related(
-            'project_offers',
-            'project_offers__technician_user',
-            'project_offers__technician_user__user_type',
-            'disputes'
-            # Remove 'review' from prefetch_related as we're using annotations
-        ).order_by('-order_id')
+        # accept_offer often stops at a permission or state check, so it loads the
+        # order alone and prefetches for the response only once the offer is accepted
+        if self.action == 'accept_offer':
+            base_queryset = self.queryset.all()
+        elif self.action == 'public_detail':
+            base_queryset = self.public_detail_queryset.all()
+        else:
+            base_queryset = self.prefetched_queryset.all()
 
         # For 'available_for_offer' and 'public_detail' actions, always filter for OPEN orders with no assigned technician
-        if self.action in ['available_for_offer', 'public_detail']:
+        if self.action in self._PUBLIC_ACTIONS:
             return base_queryset.filter(technician_user__isnull=True, order_status='OPEN')
 
 
         # For detail views (retrieve, update, destroy, and custom actions like accept_offer, mark_job_done, etc.)
         # always return the full queryset. Permissions will then handle whether the user can actually access/modify it.
-        if self.detail or self.action in ['accept_offer', 'decline_offer', 'mark_job_done', 'release_funds', 'initiate_dispute', 'cancel_order', 'offers', 'start_job']: # Added start_job
+        if self.detail or self.action in self._OBJECT_ACTIONS:
             return base_queryset
 
-        # For list actions, apply specific filtering based on user role
-        if not user.is_authenticated:
-            return Order.objects.none() # Unauthenticated users see no orders in generic list, handled above for 'available_for_offer'
+        # For list actions, apply specific filtering based on user role. The list
+        # permissions require authentication, and orders_visible_to matches no rows for
+        # anonymous users anyway.
+        if self.action == 'list':
+            base_queryset = base_queryset.select_related(None).select_related(
+                *self.list_select_related_fields
+            ).only(*self.list_only_fields)
 
         # Check if we want orders with disputes only
         has_dispute = self.request.query_params.get('has_dispute')
         if has_dispute and has_dispute.lower() == 'true':
-            base_queryset = base_queryset.filter(disputes__isnull=False).distinct()
+            base_queryset = base_queryset.filter(HAS_DISPUTE)
 
         # Add order_status filter
         order_status = self.request.query_params.get('order_status')
@@ -171,10 +312,9 @@ class OrderViewSet(viewsets.ModelViewSet):
             base_queryset = base_queryset.filter(order_status=order_status)
             
         me = self.request.query_params.get('me') or ""
-        if user.user_type.user_type_name == 'admin' and me.lower() != 'true':
-            return base_queryset
-        elif user.user_type.user_type_name in ['client' , 'technician', 'admin'] :
-            return base_queryset.filter(client_user=user)
+        visible = orders_visible_to(user, me=me.lower() == 'true')
+        if visible is not None:
+            return base_queryset.filter(visible)
 
 
         return Order.objects.none() # Default fallback, should not be reached with proper user type handling
@@ -186,33 +326,38 @@ class OrderViewSet(viewsets.ModelViewSet):
         # Create the order with the client_user set to the authenticated user
         order = serializer.save(client_user=user)
         
+        # Notifications are written once the order commits, outside the request's
+        # transaction, and never for an order that was rolled back
         # 1. Notify client (confirmation)
-        with db_transaction.atomic():
-            create_notification(
-                user=user,
-                notification_type='order_created',
-                title=ARABIC_NOTIFICATIONS['order_created_title'],
-                message=ARABIC_NOTIFICATIONS['order_created_message'].format(order_id=order.order_id),
-                related_order=order
-            )
+        create_notification_on_commit(
+            user=user,
+            notification_type='order_created',
+            title=ARABIC_NOTIFICATIONS['order_created_title'],
+            message=ARABIC_NOTIFICATIONS['order_created_message'].format(order_id=order.order_id),
+            related_order=order
+        )
         
         # 2. Notify all technicians (new project available) - can be refined later
-        technicians = User.objects.filter(user_type__user_type_name='technician')
-        for tech_user in technicians:
-            create_notification(
-                user=tech_user,
-                notification_type='new_project_available',
-                title=ARABIC_NOTIFICATIONS['new_project_available_title'],
-                message=ARABIC_NOTIFICATIONS['new_project_available_message'].format(order_id=order.order_id),
-                related_order=order
-            )
+        technician_ids = list(User.objects.filter(user_type__user_type_name='technician').values_list('pk', flat=True))
+        create_notifications_bulk_on_commit(
+            user_ids=technician_ids,
+            notification_type='new_project_available',
+            title=ARABIC_NOTIFICATIONS['new_project_available_title'],
+            message=ARABIC_NOTIFICATIONS['new_project_available_message'].format(order_id=order.order_id),
+            related_order=order
+        )
 
     @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny])
     def available_for_offer(self, request):
         """
         Return orders that are available for technician offers.
         These are orders without an assigned technician and with status 'OPEN'.
+        The board is the same for every caller, so one cached copy per page is shared.
+        Responses are always paginated (10 per page by default, page_size at most 100).
         """
+        return cached_list_response('available', request, partial(self._available_for_offer, request), per_user=False)
+
+    def _available_for_offer(self, request):
         user = request.user
         # The permission_classes now allow any user, but the filtering below ensures only
         # relevant orders are shown. If the user is authenticated as a technician,
@@ -220,27 +365,17 @@ class OrderViewSet(viewsets.ModelViewSet):
         # Removed explicit PermissionDenied check for technicians as AllowAny handles it.
 
         # Get orders without assigned technician and in OPEN status
-        available_orders = Order.objects.filter(
-            technician_user__isnull=True,
-            order_status='OPEN'
-        ).select_related(
-            'client_user', 
-            'client_user__user_type',
-            'service'
-        ).prefetch_related(
-            'project_offers',
-            'project_offers__technician_user',
-            'project_offers__technician_user__user_type'
-        ).order_by('-creation_timestamp') # Keep original sorting for this specific action
-
-        # Apply pagination
+        # get_queryset applies the filter and the relations OrderSerializer renders
+        # Newest first by order_id, which follows creation order (creation_timestamp is
+        # only a date) and is what the open-board partial index is sorted on
+        available_orders = self.get_queryset()
+
+        # OrderPagination always returns a page (its page_size is the fallback for a
+        # missing or invalid one, capped at max_page_size), so a response holds at
+        # most 100 orders
         page = self.paginate_queryset(available_orders)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(available_orders, many=True)
-        return Response(serializer.data)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=True, methods=['get'], permission_classes=[permissions.AllowAny])
     def public_detail(self, request, order_id=None):
@@ -249,12 +384,11 @@ class OrderViewSet(viewsets.ModelViewSet):
         Accessible by any user (authenticated or unauthenticated).
         """
         try:
-            # Get the object and then apply additional filters to ensure it's public
+            # get_queryset only matches public orders (OPEN, no assigned technician), so
+            # any other order is a miss in the lookup itself
             order = self.get_object()
-            if order.technician_user is not None or order.order_status != 'OPEN':
-                raise NotFound("Project not found or not publicly available.")
-        except Order.DoesNotExist:
-            raise NotFound("Project not found.")
+        except Http404:
+            raise NotFound("Project not found or not publicly available.")
 
         # Serialize the order with public details
         order_serializer = PublicOrderSerializer(order)
@@ -263,7 +397,7 @@ class OrderViewSet(viewsets.ModelViewSet):
         project_offers = ProjectOffer.objects.filter(order=order).select_related(
             'technician_user',
             'technician_user__user_type'
-        ).order_by('-offer_date', '-offer_id')
+        ).only(*self.offer_detail_only_fields).prefetch_related('technician_user__received_reviews').order_by('-offer_date', '-offer_id')
 
         offers_serializer = ProjectOfferDetailSerializer(project_offers, many=True, context={'request': request})
 
@@ -285,21 +419,25 @@ class OrderViewSet(viewsets.ModelViewSet):
             raise NotFound("Order not found.")
 
         # Check if user owns this order, is the assigned technician, or is admin
-        if not (order.client_user == request.user or \
-                (order.technician_user == request.user and request.user.user_type.user_type_name == 'technician') or \
-                request.user.user_type.user_type_name == 'admin'):
+        if not is_order_party_or_admin(order, request.user):
             raise PermissionDenied("You can only view offers for your own orders or assigned tasks.")
 
-        offers = ProjectOffer.objects.filter(order=order).select_related(
-            'technician_user', 
-            'technician_user__user_type'
-        ).order_by('-offer_date', '-offer_id')
+        # get_object already prefetched the order's offers; page through that list
+        # instead of querying them again. Cursor pages need a queryset to order on.
+        # ProjectOfferSerializer renders technician_user as an id, so no join is needed.
+        prefetched_offers = getattr(order, '_prefetched_objects_cache', {}).get('project_offers')
+        if prefetched_offers is not None and request.query_params.get('paginate') != 'cursor':
+            offers = sorted(prefetched_offers, key=lambda offer: (offer.offer_date, offer.offer_id), reverse=True)
+        else:
+            offers = ProjectOffer.objects.filter(order=order).order_by('-offer_date', '-offer_id')
         
-        # Apply pagination
-        page = self.paginate_queryset(offers)
+        # Apply pagination. Offers page 20 at a time like the project offer list, but
+        # cursor mode keeps the offer_date order of the numbered pages.
+        paginator = OrderOfferPagination()
+        page = paginator.paginate_queryset(offers, request, view=self)
         if page is not None:
             serializer = ProjectOfferSerializer(page, many=True, context={'request': request})
-            return self.get_paginated_response(serializer.data)
+            return paginator.get_paginated_response(serializer.data)
 
         serializer = ProjectOfferSerializer(offers, many=True, context={'request': request})
         return Response(serializer.data)
@@ -337,17 +475,26 @@ class OrderViewSet(viewsets.ModelViewSet):
 
         # Implement atomic transaction for escrow
         with db_transaction.atomic():
-            client_user.refresh_from_db() # Lock client user row
-            technician_user.refresh_from_db() # Lock technician user row
-
-            # Check if client has sufficient funds
-            if client_user.available_balance < offered_price:
+            # Lock the order and re-check its status, so two concurrent accepts cannot
+            # both move funds. Only the status is re-read: a refresh would drop the
+            # relations already loaded for the response.
+            locked_status = LOCKED_ORDERS.filter(pk=order.pk).values_list('order_status', flat=True).get()
+            if locked_status not in ['OPEN', 'AWAITING_CLIENT_ESCROW_CONFIRMATION']:
+                raise ValidationError({'detail': f'Order is not in a state to accept offers. Current status: {locked_status}'})
+
+            # Move funds from client's available balance to in_escrow_balance in one
+            # UPDATE, which only matches while the client has sufficient funds. The
+            # database applies it to the current balances, so concurrent debits cannot
+            # overdraw the account.
+            moved = User.objects.filter(pk=client_user.pk, available_balance__gte=offered_price).update(
+                available_balance=models.F('available_balance') - offered_price,
+                in_escrow_balance=models.F('in_escrow_balance') + offered_price,
+            )
+            if not moved:
                 raise ValidationError({'detail': 'Insufficient available balance to accept this offer.'})
-
-            # Move funds from client's available balance to in_escrow_balance
+            # Mirror the move on the loaded instance for the response
             client_user.available_balance -= offered_price
             client_user.in_escrow_balance += offered_price
-            client_user.save(update_fields=['available_balance', 'in_escrow_balance'])
 
             # Create an escrow hold transaction
             Transaction.objects.create(
@@ -364,19 +511,24 @@ class OrderViewSet(viewsets.ModelViewSet):
             order.technician_user = technician_user
             order.order_status = 'ACCEPTED' # Funds are now in escrow, job is accepted (Ensuring uppercase)
             order.final_price = offered_price # Set final price
-            order.job_start_timestamp = datetime.now() # Mark job start
+            now = timezone.now()
+            order.job_start_timestamp = now # Mark job start
             # Set auto_release_date (e.g., 7 days from now)
-            order.auto_release_date = datetime.now() + timedelta(days=7) # Example: 7 days for client to respond
+            order.auto_release_date = now + timedelta(days=7) # Example: 7 days for client to respond
             order.save()
 
-            # Update offer statuses
-            ProjectOffer.objects.filter(order=order).exclude(offer_id=offer_to_accept.offer_id).update(status='rejected')
+            # Accept this offer and reject the others in one UPDATE
+            ProjectOffer.objects.filter(order=order).update(status=models.Case(
+                models.When(offer_id=offer_to_accept.offer_id, then=models.Value('accepted')),
+                default=models.Value('rejected'),
+                output_field=models.CharField(),
+            ))
             offer_to_accept.status = 'accepted'
-            offer_to_accept.save()
 
             # Send notifications
             self._send_offer_notifications(order, offer_to_accept)
 
+            models.prefetch_related_objects([order], *self.prefetch_related_fields)
             serializer = self.get_serializer(order)
             return Response({
                 'message': 'Offer accepted and funds moved to escrow successfully.',
@@ -431,39 +583,43 @@ class OrderViewSet(viewsets.ModelViewSet):
         }, status=status.HTTP_200_OK)
 
     def _send_offer_notifications(self, order, accepted_offer):
-        """Send notifications when an offer is accepted."""
-        try:
-            # Notify the accepted technician
-            create_notification(
-                user=accepted_offer.technician_user,
-                notification_type='offer_accepted',
-                title=ARABIC_NOTIFICATIONS['offer_accepted_title'],
-                message=ARABIC_NOTIFICATIONS['offer_accepted_message'].format(order_id=order.order_id),
+        """
+        Send notifications when an offer is accepted, all in one INSERT. They are written
+        once the acceptance commits; a failure to write them is logged and does not fail the request.
+        """
+        # Notify the accepted technician
+        notifications = [Notification(
+            user_id=accepted_offer.technician_user_id,
+            notification_type='offer_accepted',
+            title=ARABIC_NOTIFICATIONS['offer_accepted_title'],
+            message=ARABIC_NOTIFICATIONS['offer_accepted_message'].format(order_id=order.order_id),
+            related_order=order
+        )]
+
+        # Notify rejected technicians
+        rejected_technician_ids = ProjectOffer.objects.filter(order=order).exclude(status='accepted').values_list('technician_user_id', flat=True) # Exclude accepted offer, check any status not accepted
+        rejected_message = ARABIC_NOTIFICATIONS['offer_rejected_message'].format(order_id=order.order_id)
+        notifications.extend(
+            Notification(
+                user_id=technician_id,
+                notification_type='offer_rejected',
+                title=ARABIC_NOTIFICATIONS['offer_rejected_title'],
+                message=rejected_message,
                 related_order=order
             )
+            for technician_id in rejected_technician_ids
+        )
 
-            # Notify rejected technicians
-            rejected_offers = ProjectOffer.objects.filter(order=order).exclude(status='accepted') # Exclude accepted offer, check any status not accepted
-            for rejected_offer in rejected_offers:
-                create_notification(
-                    user=rejected_offer.technician_user,
-                    notification_type='offer_rejected',
-                    title=ARABIC_NOTIFICATIONS['offer_rejected_title'],
-                    message=ARABIC_NOTIFICATIONS['offer_rejected_message'].format(order_id=order.order_id),
-                    related_order=order
-                )
+        # Notify the client
+        notifications.append(Notification(
+            user_id=order.client_user_id,
+            notification_type='offer_accepted',
+            title=ARABIC_NOTIFICATIONS['offer_accepted_client_title'],
+            message=ARABIC_NOTIFICATIONS['offer_accepted_client_message'].format(order_id=order.order_id),
+            related_order=order
+        ))
 
-            # Notify the client
-            create_notification(
-                user=order.client_user,
-                notification_type='offer_accepted',
-                title=ARABIC_NOTIFICATIONS['offer_accepted_client_title'],
-                message=ARABIC_NOTIFICATIONS['offer_accepted_client_message'].format(order_id=order.order_id),
-                related_order=order
-            )
-        except Exception as e:
-            # Log the error but don't fail the request
-            print(f"Error sending notifications: {e}")
+        save_notifications_on_commit(notifications)
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated, IsTechnicianOwnerOrAdmin])
     def start_job(self, request, order_id=None):
@@ -478,7 +634,7 @@ class OrderViewSet(viewsets.ModelViewSet):
             raise NotFound("Order not found.")
 
         # Ensure the authenticated user is the assigned technician
-        if order.technician_user != request.user:
+        if order.technician_user_id != request.user.pk:
             raise PermissionDenied("You are not the assigned technician for this order.")
 
         # Ensure the order is in 'ACCEPTED' status
@@ -486,7 +642,7 @@ class OrderViewSet(viewsets.ModelViewSet):
             raise ValidationError({'detail': f'Order must be in "ACCEPTED" status to start the job. Current status: {order.order_status}'})
 
         with db_transaction.atomic():
-            order.refresh_from_db()
+            order.refresh_from_db(from_queryset=LOCKED_ORDERS) # Lock order row
             order.order_status = 'IN_PROGRESS'
             order.save(update_fields=['order_status'])
 
@@ -519,7 +675,7 @@ class OrderViewSet(viewsets.ModelViewSet):
             raise NotFound("Order not found.")
 
         # Ensure the authenticated user is the assigned technician
-        if order.technician_user != request.user:
+        if order.technician_user_id != request.user.pk:
             raise PermissionDenied("You are not the assigned technician for this order.")
 
         # Ensure the order is in 'IN_PROGRESS' status
@@ -527,13 +683,13 @@ class OrderViewSet(viewsets.ModelViewSet):
             raise ValidationError({'detail': f'Order must be in "IN_PROGRESS" status to mark as done. Current status: {order.order_status}'})
 
         with db_transaction.atomic():
-            order.refresh_from_db() # Lock order row
+            order.refresh_from_db(from_queryset=LOCKED_ORDERS) # Lock order row
             order.order_status = 'AWAITING_RELEASE' # Ensuring uppercase
-            order.job_done_timestamp = datetime.now()
+            order.job_done_timestamp = timezone.now()
             order.save(update_fields=['order_status', 'job_done_timestamp'])
 
-            # Notify the client that the job is done
-            create_notification(
+            # Notify the client that the job is done, once the status change commits
+            create_notification_on_commit(
                 user=order.client_user,
                 notification_type='job_done',
                 title=ARABIC_NOTIFICATIONS['job_done_title'],
@@ -561,7 +717,7 @@ class OrderViewSet(viewsets.ModelViewSet):
             raise NotFound("Order not found.")
 
         # Ensure the authenticated user is the client who owns the order
-        if order.client_user != request.user:
+        if order.client_user_id != request.user.pk:
             raise PermissionDenied("You are not the client for this order.")
 
         # Ensure the order is in 'AWAITING_RELEASE' status
@@ -573,9 +729,10 @@ class OrderViewSet(viewsets.ModelViewSet):
         amount_to_release = order.final_price
 
         with db_transaction.atomic():
-            client_user.refresh_from_db() # Lock client user row
-            technician_user.refresh_from_db() # Lock technician user row
-            order.refresh_from_db() # Lock order row
+            order.refresh_from_db(from_queryset=LOCKED_ORDERS) # Lock order row
+            # Re-check under the lock, so a concurrent release cannot pay out twice
+            if order.order_status != 'AWAITING_RELEASE':
+                raise ValidationError({'detail': f'Order must be in "AWAITING_RELEASE" status to release funds. Current status: {order.order_status}'})
 
             # Platform Commission Logic (5%)
             gross_amount = order.final_price
@@ -583,44 +740,52 @@ class OrderViewSet(viewsets.ModelViewSet):
             platform_fee = gross_amount * commission_rate
             technician_payout = gross_amount - platform_fee
 
-            # Ensure funds are in escrow
-            if client_user.in_escrow_balance < gross_amount:
+            # A technician can be the client on another order, so lock both balance
+            # rows in a fixed order before touching either
+            lock_users(client_user.pk, technician_user.pk)
+
+            # Move funds from client's in_escrow_balance, in one UPDATE that only
+            # matches while the funds are in escrow (see accept_offer)
+            released = User.objects.filter(pk=client_user.pk, in_escrow_balance__gte=gross_amount).update(
+                in_escrow_balance=models.F('in_escrow_balance') - gross_amount
+            )
+            if not released:
                 # This should ideally not happen if escrow deposit was successful
                 raise ValidationError({'detail': 'Error: Insufficient funds in escrow. Please contact support.'})
 
-            # Move funds from client's in_escrow_balance
-            client_user.in_escrow_balance -= gross_amount
-            client_user.save(update_fields=['in_escrow_balance'])
-
             # Add NET amount to technician's pending_balance
-            technician_user.pending_balance += technician_payout
-            technician_user.save(update_fields=['pending_balance'])
-
-            # Create Payout Transaction (To Technician)
-            Transaction.objects.create(
-                source_user=client_user,
-                destination_user=technician_user,
-                order=order,
-                transaction_type='PAYOUT',
-                amount=technician_payout,
-                currency='EGP',
-                payment_method='Escrow'
+            User.objects.filter(pk=technician_user.pk).update(
+                pending_balance=models.F('pending_balance') + technician_payout
             )
+            # Mirror both moves on the loaded instances for the response
+            client_user.in_escrow_balance -= gross_amount
+            technician_user.pending_balance += technician_payout
 
-            # Create Platform Fee Transaction (To System)
-            Transaction.objects.create(
-                source_user=client_user,
-                destination_user=None, # System
-                order=order,
-                transaction_type='PLATFORM_FEE',
-                amount=platform_fee,
-                currency='EGP',
-                payment_method='Escrow'
-            )
+            # Create the Payout (To Technician) and Platform Fee (To System) transactions in one INSERT
+            Transaction.objects.bulk_create([
+                Transaction(
+                    source_user=client_user,
+                    destination_user=technician_user,
+                    order=order,
+                    transaction_type='PAYOUT',
+                    amount=technician_payout,
+                    currency='EGP',
+                    payment_method='Escrow'
+                ),
+                Transaction(
+                    source_user=client_user,
+                    destination_user=None, # System
+                    order=order,
+                    transaction_type='PLATFORM_FEE',
+                    amount=platform_fee,
+                    currency='EGP',
+                    payment_method='Escrow'
+                ),
+            ])
 
             # Update the order status and financial records
             order.order_status = 'COMPLETED'
-            order.job_completion_timestamp = datetime.now()
+            order.job_completion_timestamp = timezone.now()
             order.commission_percentage = commission_rate * 100
             order.platform_commission_amount = platform_fee
             order.amount_to_technician = technician_payout
@@ -632,8 +797,8 @@ class OrderViewSet(viewsets.ModelViewSet):
                 'amount_to_technician'
             ])
 
-        # Notify technician of fund release
-        create_notification(
+        # Notify technician of fund release, once the release commits
+        create_notification_on_commit(
             user=technician_user,
             notification_type='funds_released',
             title=ARABIC_NOTIFICATIONS['funds_released_title'],
@@ -678,9 +843,7 @@ class OrderViewSet(viewsets.ModelViewSet):
 
         # Ensure the authenticated user is either the client owner, assigned technician, or admin
         user = request.user
-        if not (order.client_user == user or \
-                (order.technician_user == user and user.user_type.user_type_name == 'technician') or \
-                user.user_type.user_type_name == 'admin'):
+        if not is_order_party_or_admin(order, user):
             raise PermissionDenied("You do not have permission to initiate a dispute for this order.")
 
         # Ensure the order is in a state where a dispute can be initiated
@@ -692,14 +855,17 @@ class OrderViewSet(viewsets.ModelViewSet):
             raise ValidationError({'argument': 'Dispute argument is required.'})
         
         # Ensure a technician is assigned if it's not an admin initiating
-        if not order.technician_user and user.user_type.user_type_name != 'admin':
+        if order.technician_user_id is None and user.role_name != 'admin':
             raise ValidationError({'detail': 'Cannot initiate a dispute for an order without an assigned technician.'})
 
         with db_transaction.atomic():
-            order.refresh_from_db() # Lock order row
+            # Lock the order row, re-reading only what can change. A full refresh would
+            # drop the relations get_object loaded, and the response would then load
+            # them again one by one; only the disputes are dropped, since one is added.
+            order.refresh_from_db(fields=['order_status', 'disputes'], from_queryset=LOCKED_ORDERS)
 
             # Determine who is the initiator for the dispute record
-            initiator_role = 'client' if order.client_user == user else ('technician' if order.technician_user == user else 'admin')
+            initiator_role = 'client' if order.client_user_id == user.pk else ('technician' if order.technician_user_id == user.pk else 'admin')
 
             dispute_fields = {
                 'order': order,
@@ -719,37 +885,34 @@ class OrderViewSet(viewsets.ModelViewSet):
             order.order_status = 'DISPUTED'
             order.save(update_fields=['order_status'])
 
-            # Send notifications
-            if order.client_user != user: # Notify client if they are not the initiator
-                create_notification(
-                    user=order.client_user,
-                    notification_type='dispute_initiated',
-                    title=ARABIC_NOTIFICATIONS['dispute_initiated_title'],
-                    message=ARABIC_NOTIFICATIONS['dispute_initiated_message'].format(user_name=user.get_full_name(), order_id=order.order_id),
-                    related_order=order,
-                    related_dispute=dispute
-                )
-            if order.technician_user and order.technician_user != user: # Notify technician if they are not the initiator
-                create_notification(
-                    user=order.technician_user,
-                    notification_type='dispute_initiated',
-                    title=ARABIC_NOTIFICATIONS['dispute_initiated_title'],
-                    message=ARABIC_NOTIFICATIONS['dispute_initiated_message'].format(user_name=user.get_full_name(), order_id=order.order_id),
-                    related_order=order,
-                    related_dispute=dispute
-                )
-            # Notify all admins
-            admins = User.objects.filter(user_type__user_type_name='admin')
-            for admin_user in admins:
-                if admin_user != user: # Don't notify admin if they are the initiator
-                    create_notification(
-                        user=admin_user,
-                        notification_type='dispute_new',
-                        title=ARABIC_NOTIFICATIONS['dispute_new_title'],
-                        message=ARABIC_NOTIFICATIONS['dispute_new_message'].format(order_id=order.order_id, user_name=user.get_full_name()),
-                        related_order=order,
-                        related_dispute=dispute
-                    )
+            # Send notifications once the dispute commits, outside the order row lock; the
+            # client and the technician get the same message, so it is formatted once
+            user_name = user.get_full_name()
+            initiated_message = ARABIC_NOTIFICATIONS['dispute_initiated_message'].format(user_name=user_name, order_id=order.order_id)
+            # Notify the client and the assigned technician, unless they are the initiator
+            participant_ids = [
+                participant_id for participant_id in (order.client_user_id, order.technician_user_id)
+                if participant_id is not None and participant_id != user.pk
+            ]
+            create_notifications_bulk_on_commit(
+                user_ids=participant_ids,
+                notification_type='dispute_initiated',
+                title=ARABIC_NOTIFICATIONS['dispute_initiated_title'],
+                message=initiated_message,
+                related_order=order,
+                related_dispute=dispute
+            )
+            # Notify all admins except the initiator with one message, one INSERT per
+            # 500 admins. The admin ids come from the cache when it is enabled
+            admin_ids = [admin_id for admin_id in get_admin_ids() if admin_id != user.pk]
+            create_notifications_bulk_on_commit(
+                user_ids=admin_ids,
+                notification_type='dispute_new',
+                title=ARABIC_NOTIFICATIONS['dispute_new_title'],
+                message=ARABIC_NOTIFICATIONS['dispute_new_message'].format(order_id=order.order_id, user_name=user_name),
+                related_order=order,
+                related_dispute=dispute
+            )
 
         serializer = self.get_serializer(order)
         return Response({
@@ -768,34 +931,20 @@ class OrderViewSet(viewsets.ModelViewSet):
         """
         user = request.user
         
-        # Use the same queryset logic as WorkerTasksViewSet to find orders for technicians
-        # This ensures technicians can access orders where they are the technician_user
+        # Look the order up directly rather than through get_queryset, so technicians can
+        # access orders where they are the technician_user. The offer, review and dispute
+        # prefetches only run once the caller is allowed to see the order.
         try:
-            order = Order.objects.select_related(
-                'client_user', 
-                'client_user__user_type',
-                'technician_user', 
-                'technician_user__user_type',
-                'service'
-            ).annotate(
-                review_rating=models.F('review__rating'),
-                review_comment=models.F('review__comment')
-            ).prefetch_related(
-                'project_offers',
-                'project_offers__technician_user',
-                'project_offers__technician_user__user_type',
-                'disputes'
-            ).get(order_id=order_id)
+            order = self.queryset.get(order_id=order_id)
         except Order.DoesNotExist:
             raise NotFound("Order not found.")
 
         # Check if user has access to this order for dispute purposes
-        if not (order.client_user == user or \
-                (order.technician_user == user and user.user_type.user_type_name == 'technician') or \
-                user.user_type.user_type_name == 'admin'):
+        if not is_order_party_or_admin(order, user):
             raise PermissionDenied("You don't have permission to view this order for dispute purposes.")
 
         # Serialize the order with full details
+        models.prefetch_related_objects([order], *self.prefetch_related_fields)
         serializer = self.get_serializer(order)
         return Response(serializer.data)
 
@@ -813,8 +962,8 @@ class OrderViewSet(viewsets.ModelViewSet):
             raise NotFound("Order not found.")
 
         user = request.user
-        is_client_owner = (order.client_user == user)
-        is_admin = (user.user_type.user_type_name == 'admin')
+        is_client_owner = (order.client_user_id == user.pk)
+        is_admin = (user.role_name == 'admin')
 
         if not (is_client_owner or is_admin):
             raise PermissionDenied("You do not have permission to cancel this order.")
@@ -824,21 +973,26 @@ class OrderViewSet(viewsets.ModelViewSet):
             raise ValidationError({'detail': f'Order cannot be cancelled in current status: {order.order_status}'})
 
         with db_transaction.atomic():
-            order.refresh_from_db() # Lock order row
+            # Lock the order row, re-reading only what can change and keeping the
+            # relations get_object loaded for the response (see initiate_dispute)
+            order.refresh_from_db(fields=['order_status', 'final_price'], from_queryset=LOCKED_ORDERS)
             client_user = order.client_user
             technician_user = order.technician_user
             amount_in_escrow = order.final_price if order.final_price else Decimal('0.00')
             
             # If the order was accepted and funds are in escrow, refund them
             if order.order_status in ['ACCEPTED', 'IN_PROGRESS', 'AWAITING_RELEASE'] and amount_in_escrow > 0:
-                client_user.refresh_from_db()
-                
-                if client_user.in_escrow_balance < amount_in_escrow:
+                # Refund from escrow to the available balance in one UPDATE that only
+                # matches while the funds are in escrow (see release_funds)
+                refunded = User.objects.filter(pk=client_user.pk, in_escrow_balance__gte=amount_in_escrow).update(
+                    in_escrow_balance=models.F('in_escrow_balance') - amount_in_escrow,
+                    available_balance=models.F('available_balance') + amount_in_escrow
+                )
+                if not refunded:
                     raise ValidationError({'detail': 'Error: Insufficient funds in escrow for refund. Contact support.'})
-                
+                # Mirror the refund on the loaded instance for the response
                 client_user.in_escrow_balance -= amount_in_escrow
-                client_user.available_balance += amount_in_escrow # Refund to available balance
-                client_user.save(update_fields=['in_escrow_balance', 'available_balance'])
+                client_user.available_balance += amount_in_escrow
 
                 Transaction.objects.create(
                     source_user=client_user,
@@ -851,31 +1005,36 @@ class OrderViewSet(viewsets.ModelViewSet):
                 )
                 order.order_status = 'REFUNDED'
                 message_to_client = ARABIC_NOTIFICATIONS['order_cancelled_refund_message'].format(order_id=order.order_id, amount=amount_in_escrow)
-                message_to_technician = ARABIC_NOTIFICATIONS['order_cancelled_tech_message'].format(order_id=order.order_id, amount=amount_in_escrow)
+                refunded_amount = amount_in_escrow
             else:
                 # If no funds in escrow (order was 'OPEN')
                 order.order_status = 'CANCELLED'
                 message_to_client = ARABIC_NOTIFICATIONS['order_cancelled_no_funds_message'].format(order_id=order.order_id)
-                message_to_technician = ARABIC_NOTIFICATIONS['order_cancelled_tech_message'].format(order_id=order.order_id, amount='0.00')
+                refunded_amount = '0.00'
 
+            # Already a single UPDATE of one column; save() rather than queryset.update() so
+            # post_save still invalidates the cached order lists (see orders.signals)
             order.save(update_fields=['order_status'])
 
-            # Send notifications
-            create_notification(
+            # Send notifications once the cancellation commits, outside the order row
+            # lock, in one INSERT
+            title = ARABIC_NOTIFICATIONS['order_cancelled_title']
+            notifications = [Notification(
                 user=client_user,
                 notification_type='order_cancelled',
-                title=ARABIC_NOTIFICATIONS['order_cancelled_title'],
+                title=title,
                 message=message_to_client,
                 related_order=order
-            )
-            if technician_user: # Only notify technician if one was assigned
-                create_notification(
+            )]
+            if technician_user: # Only notify technician if one was assigned, and only then format the message
+                notifications.append(Notification(
                     user=technician_user,
                     notification_type='order_cancelled',
-                    title=ARABIC_NOTIFICATIONS['order_cancelled_title'],
-                    message=message_to_technician,
+                    title=title,
+                    message=ARABIC_NOTIFICATIONS['order_cancelled_tech_message'].format(order_id=order.order_id, amount=refunded_amount),
                     related_order=order
-                )
+                ))
+            save_notifications_on_commit(notifications)
             
         serializer = self.get_serializer(order)
         return Response({
@@ -889,7 +1048,7 @@ class OrderViewSet(viewsets.ModelViewSet):
         }, status=status.HTTP_200_OK)
 
 
-class ProjectOfferViewset(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
+class ProjectOfferViewset(viewsets.ModelViewSet):
     """
     API endpoint that allows Project Offers to be viewed or edited.
 
@@ -926,33 +1085,49 @@ class ProjectOfferViewset(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
     Permissions: Authenticated Technician User (owner) or Admin User.
     Usage: DELETE /api/orders/project_offers/{offer_id}/
     """
-    queryset = ProjectOffer.objects.all()
+    # Newest first by primary key, so pages are stable and read in index order
+    queryset = ProjectOffer.objects.order_by('-offer_id')
+    pagination_class = ProjectOfferPagination
+    # ProjectOfferSerializer renders order and technician_user as bare ids, read from
+    # the offer row itself. Only detail actions follow a relation: the object
+    # permissions and update_client_offer read order.client_user_id.
+    select_related_fields = ('order',)
     serializer_class = ProjectOfferSerializer
     lookup_field = 'offer_id'
+    renderer_classes = OrderViewSet.renderer_classes
+
+    # Permission classes per action, composed once at import rather than on every request
+    _WRITE_PERMISSIONS = [IsAdminUser | (IsTechnicianUser & IsTechnicianOwnerOrAdmin)]
+    _PERMISSIONS_BY_ACTION = {
+        'create': [IsAdminUser | IsTechnicianUser],
+        'update': _WRITE_PERMISSIONS,
+        'partial_update': _WRITE_PERMISSIONS,
+        'destroy': _WRITE_PERMISSIONS,
+    }
+    # list, retrieve
+    _READ_PERMISSIONS = [IsAdminUser | (IsTechnicianUser & IsTechnicianOwnerOrAdmin) | (IsClientUser & IsClientOwnerOrAdmin)]
 
     def get_permissions(self):
-        if self.action == 'create':
-            self.permission_classes = [IsAdminUser | IsTechnicianUser]
-        elif self.action in ['update', 'partial_update', 'destroy']:
-            self.permission_classes = [IsAdminUser | (IsTechnicianUser & IsTechnicianOwnerOrAdmin)]
-        else: # list, retrieve
-            self.permission_classes = [IsAdminUser | (IsTechnicianUser & IsTechnicianOwnerOrAdmin) | (IsClientUser & IsClientOwnerOrAdmin)]
+        self.permission_classes = self._PERMISSIONS_BY_ACTION.get(self.action, self._READ_PERMISSIONS)
         return super().get_permissions()
 
+    def list(self, request, *args, **kwargs):
+        return cached_list_response('projectoffers', request, partial(super().list, request, *args, **kwargs))
+
     def get_queryset(self):
+        # Every ProjectOffer action requires an authenticated role, checked by the
+        # permissions before the queryset is built
         user = self.request.user
-        
-        base_queryset = ProjectOffer.objects.select_related(
-            'technician_user', 
-            'technician_user__user_type',
-            'order',
-            'order__client_user',
-            'order__client_user__user_type',
-            'order__service'
-        )
+        # Clone the class-level queryset: returned as-is (admins, detail actions), it
+        # would cache its rows on the shared instance and serve them to later requests
+        base_queryset = self.queryset.all()
+        if self.detail:
+            base_queryset = base_queryset.select_related(*self.select_related_fields)
+
+        role = get_user_role(user)
 
         # Admins can see all offers
-        if user.user_type.user_type_name == 'admin':
+        if role == 'admin':
             return base_queryset
 
         # For specific actions like 'retrieve', 'update', 'partial_update', 'destroy',
@@ -961,24 +1136,22 @@ class ProjectOfferViewset(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
         if self.detail or self.action in ['update_client_offer', 'client_offers_for_technician']: # Add other detail=True/detail=False custom actions here that do their own filtering
             return base_queryset
 
-        # For 'list' action and custom actions with detail=False that are not explicitly handled above, filter by user role
-        if user.user_type.user_type_name == 'technician':
-            # Technicians see their own project offers in the generic list
-            return base_queryset.filter(technician_user=user)
-        elif user.user_type.user_type_name == 'client':
-            # Clients see offers related to their orders
-            return base_queryset.filter(order__client_user=user)
+        # For 'list' action and custom actions with detail=False that are not explicitly handled above, filter by user role:
+        # technicians see their own offers, clients see offers on their orders
+        visible = project_offers_visible_to(user)
+        if visible is not None:
+            return base_queryset.filter(visible)
         
         return ProjectOffer.objects.none() # Default for other user types or unauthenticated
 
     def perform_create(self, serializer):
-        user = self.request.user
-        if not user.is_authenticated:
-            raise PermissionDenied("Authentication required to create project offers.")
-
-        if user.user_type.user_type_name == 'technician':
-            requested_technician_user_id = self.request.data.get('technician_user')
-            if requested_technician_user_id and int(requested_technician_user_id) != user.user_id:
+        user = self.request.user # Authenticated: create requires an admin or technician
+        role = get_user_role(user)
+        if role == 'technician':
+            # Compare the validated instance rather than re-parsing request.data: the
+            # serializer has already resolved the id, to request.user itself when it matches
+            requested_technician = serializer.validated_data.get('technician_user')
+            if requested_technician is not None and requested_technician.pk != user.pk:
                 raise PermissionDenied("Technicians can only create offers for themselves.")
             
             # Create the offer with all required fields
@@ -1000,9 +1173,9 @@ class ProjectOfferViewset(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
             except Exception as e:
                 print(f"Error sending notification: {e}")
                 
-        elif user.user_type.user_type_name == 'admin':
-            if 'technician_user' not in self.request.data:
-                raise serializers.ValidationError({"technician_user": "This field is required for admin users."})
+        elif role == 'admin':
+            # technician_user is a required serializer field, already resolved to a
+            # technician in one query during validation; save reuses that instance
             serializer.save(status='pending', offer_date=date.today())
         else:
             raise PermissionDenied("Only technicians and admins can create project offers.")
@@ -1016,29 +1189,22 @@ class ProjectOfferViewset(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
         Usage: GET /api/orders/projectoffers/client-offers-for-technician/
         """
         user = request.user
-        if not user.is_authenticated or user.user_type.user_type_name != 'technician':
+        if not user.is_authenticated or user.role_name != 'technician':
             raise PermissionDenied("Only technicians can view client offers.")
 
-        # Optimized queryset with comprehensive prefetching to minimize database queries
+        # Load only what ProjectOfferWithOrderSerializer reads: the order with its service and
+        # client, and the received reviews PublicUserSerializer lists for both users
         client_offers = ProjectOffer.objects.filter(
             offer_initiator='client',
             technician_user=user,
             status='pending'
         ).select_related(
-            'order',
-            'order__client_user',
             'order__client_user__user_type',
-            'order__service',
             'order__service__category',
-            'technician_user',
             'technician_user__user_type'
         ).prefetch_related(
-            'order__project_offers',
-            'order__project_offers__technician_user',
-            'order__project_offers__technician_user__user_type',
-            'order__disputes',
-            'order__client_user__user_type',
-            'technician_user__user_type'
+            'order__client_user__received_reviews',
+            'technician_user__received_reviews'
         ).order_by('-offer_date', '-offer_id')
 
         page = self.paginate_queryset(client_offers)
@@ -1062,7 +1228,7 @@ class ProjectOfferViewset(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
             raise NotFound("Offer not found.")
 
         # Check if the authenticated user is the creator of the offer and if it's client-initiated
-        if (offer.order.client_user != request.user or offer.offer_initiator != 'client'):
+        if (offer.order.client_user_id != request.user.pk or offer.offer_initiator != 'client'):
             raise PermissionDenied("You can only update your own client-initiated offers.")
 
         # Check if the offer is in pending status
@@ -1110,12 +1276,14 @@ class WorkerTasksViewSet(viewsets.ReadOnlyModelViewSet):
 
     list:
     Return a list of orders assigned to the authenticated technician.
-    Supports filtering by order_status using order_status__in parameter (e.g., ?order_status__in=pending,in_progress)
-    Supports limiting results using limit parameter (e.g., ?limit=3)
+    Supports filtering by order_status using order_status__in parameter (e.g., ?order_status__in=accepted,in_progress)
+    Supports limiting results using limit parameter (e.g., ?limit=3), at most 100
     Supports pagination using page and page_size parameters (e.g., ?page=1&page_size=10)
+    Responses are always paginated (10 per page by default, page_size at most 100); ?paginate=cursor
+    switches to cursor pages, which cost the same at any depth (except with limit)
     Permissions: Authenticated Technician User only.
     Usage: GET /api/orders/worker-tasks/
-    Usage: GET /api/orders/worker-tasks/?order_status__in=pending,in_progress&limit=3
+    Usage: GET /api/orders/worker-tasks/?order_status__in=accepted,in_progress&limit=3
     Usage: GET /api/orders/worker-tasks/?has_dispute=true&page=1&page_size=10
 
     retrieve:
@@ -1126,53 +1294,75 @@ class WorkerTasksViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = OrderSerializer
     lookup_field = 'order_id'
     pagination_class = OrderPagination
+    # Same serializer as OrderViewSet, so the same relations and list columns
+    select_related_fields = OrderViewSet.select_related_fields
+    list_select_related_fields = OrderViewSet.list_select_related_fields
+    prefetch_related_fields = OrderViewSet.prefetch_related_fields
+    list_only_fields = OrderViewSet.list_only_fields
+    queryset = OrderViewSet.prefetched_queryset
+    renderer_classes = OrderViewSet.renderer_classes
+    # Same permission for every action, so the default get_permissions applies
+    permission_classes = [permissions.IsAuthenticated]
+
+    # Columns of the lite list, read as plain dicts
+    lite_fields = (
+        'order_id', 'order_status', 'final_price', 'client_user__first_name',
+        'client_user__last_name', 'service__service_name', 'review__rating',
+    )
+
+    def list(self, request, *args, **kwargs):
+        return cached_list_response('worker-tasks', request, partial(super().list, request, *args, **kwargs))
+
+    @action(detail=False, methods=['get'])
+    def lite(self, request):
+        """
+        Return a compact list of the authenticated technician's tasks: status, price, client
+        name, service name and review rating. Rows are read with values() and returned as-is,
+        skipping model instances and the serializer. Takes the same filters, limit and
+        pagination as the list action.
+        Permissions: Authenticated User.
+        Usage: GET /api/orders/worker-tasks/lite/?order_status__in=accepted,in_progress
+        """
+        def build_response():
+            queryset = self.filter_queryset(self.get_queryset())
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                return self.get_paginated_response(page)
+            return Response(list(queryset))
 
-    def get_permissions(self):
-        self.permission_classes = [permissions.IsAuthenticated]
-        return [permission() for permission in self.permission_classes]
+        return cached_list_response('worker-tasks-lite', request, build_response)
 
     def get_queryset(self):
-        user = self.request.user
-        if not user.is_authenticated:
-            return Order.objects.none()
+        user = self.request.user # Authenticated, see permission_classes
 
         # All authenticated users can access this endpoint, but only technicians will have assigned orders.
         # The queryset will naturally filter for orders where technician_user=user.
         # No explicit check for user_type is needed here.
 
-        # Start with orders assigned to this technician
-        queryset = Order.objects.filter(technician_user=user).select_related(
-            'client_user', 
-            'client_user__user_type',
-            'technician_user', 
-            'technician_user__user_type',
-            'service'
-        ).annotate(
-            review_rating=models.F('review__rating'),
-            review_comment=models.F('review__comment')
-        ).prefetch_related(
-            'project_offers',
-            'project_offers__technician_user',
-            'project_offers__technician_user__user_type',
-            'disputes'  # Add disputes prefetch for the has_dispute filter
-            # Remove 'review' from prefetch_related as we're using annotations
-        )
+        # Start with orders assigned to this technician; the lite list joins only what it reads
+        if self.action == 'lite':
+            queryset = Order.objects.filter(technician_user=user).order_by('-order_id')
+        else:
+            queryset = self.queryset.filter(technician_user=user)
+        if self.action == 'list':
+            queryset = queryset.select_related(None).select_related(
+                *self.list_select_related_fields
+            ).only(*self.list_only_fields)
 
         # Check if we want orders with disputes only
         has_dispute = self.request.query_params.get('has_dispute')
         if has_dispute and has_dispute.lower() == 'true':
-            queryset = queryset.filter(disputes__isnull=False).distinct()
+            queryset = queryset.filter(HAS_DISPUTE)
 
-        # Apply status filtering if provided (use order_status, not status)
-        status_filter = self.request.query_params.get('status__in')
+        # Status list filter, accepted as order_status__in or the older status__in
+        status_filter = self.request.query_params.get('order_status__in') or self.request.query_params.get('status__in')
         if status_filter:
-            status_list = [status.strip() for status in status_filter.split(',')]
-            queryset = queryset.filter(order_status__in=status_list)
-        
-        # Also support order_status__in parameter
-        order_status_filter = self.request.query_params.get('order_status__in')
-        if order_status_filter:
-            status_list = [status.strip() for status in order_status_filter.split(',')]
+            status_list = parse_order_statuses(status_filter)
+            if not status_list:
+                return Order.objects.none() # Only unknown statuses were requested
+            # A plain IN is fine here: Django sends queries without server-side prepared
+            # statements (server_side_binding is off), so there is no plan cache for an
+            # = ANY(array) form to preserve, and the status set is small and bounded
             queryset = queryset.filter(order_status__in=status_list)
 
         # Add single order_status filter for WorkerTasksViewSet
@@ -1180,12 +1370,30 @@ class WorkerTasksViewSet(viewsets.ReadOnlyModelViewSet):
         if order_status:
             queryset = queryset.filter(order_status=order_status)
 
-        # Apply limit if provided - must do this before ordering
-        limit = self.request.query_params.get('limit')
-        if limit and limit.isdigit():
-            queryset = queryset.order_by('-order_id')[:int(limit)] # Sorted by order_id descending
-        else:
-            # Always order by creation date, most recent first
-            queryset = queryset.order_by('-order_id') # Sorted by order_id descending
+        # Ordered by order_id, most recent first, from the base queryset
+
+        if self.action == 'lite':
+            queryset = queryset.values(*self.lite_fields)
 
         return queryset
+
+    def get_limit(self):
+        """
+        The ?limit= value as a positive int, capped like page_size so a huge value cannot
+        make the database materialize the whole task list; None if absent or invalid.
+        """
+        try:
+            limit = int(self.request.query_params.get('limit', ''))
+        except ValueError:
+            return None
+        if limit <= 0:
+            return None
+        return min(limit, self.pagination_class.max_page_size)
+
+    def paginate_queryset(self, queryset):
+        # Apply limit here, after filtering, so get_queryset stays unsliced: retrieve
+        # ignores the parameter and nothing can try to filter a sliced queryset
+        limit = self.get_limit()
+        if limit is not None:
+            queryset = queryset[:limit]
+        return super().paginate_queryset(queryset)
@@ -1,6 +1,31 @@
+from functools import lru_cache
+
 from rest_framework import serializers
 from .models import Payment, PaymentMethod
 
+CARD_IMAGES_URL = "https://raw.githubusercontent.com/muhammederdem/credit-card-form/master/src/assets/images/"
+# Checked in order: the first token found in the lower-cased card type picks the logo
+CARD_IMAGES = (
+    ("visa", CARD_IMAGES_URL + "visa.png"),
+    ("master", CARD_IMAGES_URL + "mastercard.png"),
+    ("amex", CARD_IMAGES_URL + "amex.png"),
+)
+DEFAULT_CARD_IMAGE = CARD_IMAGES_URL + "chip.png"
+
+
+@lru_cache(maxsize=32)
+def card_image_url(card_type):
+    """
+    The logo URL for a card type. There are only a handful of distinct card types, so
+    each is resolved once and list responses reuse the result for every card.
+    """
+    card_type = card_type.lower()
+    for token, url in CARD_IMAGES:
+        if token in card_type:
+            return url
+    return DEFAULT_CARD_IMAGE
+
+
 class PaymentMethodSerializer(serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
     image = serializers.SerializerMethodField()
@@ -10,16 +35,21 @@ class PaymentMethodSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'masked_pan', 'card_type', 'expiration_date', 'card_holder_name', 'email', 'is_default', 'image']
         read_only_fields = ['masked_pan', 'card_type', 'expiration_date', 'email', 'image'] # These are populated via Webhook or readonly
 
+    # Every field the output shows, in Meta.fields order (user is write-only)
+    rendered_fields = tuple(name for name in Meta.fields if name != 'user')
+
     def get_image(self, obj):
         # Return a static URL or asset path for the card logo
-        card_type = (obj.card_type or "").lower()
-        if "visa" in card_type:
-            return "https://raw.githubusercontent.com/muhammederdem/credit-card-form/master/src/assets/images/visa.png"
-        elif "master" in card_type:
-            return "https://raw.githubusercontent.com/muhammederdem/credit-card-form/master/src/assets/images/mastercard.png"
-        elif "amex" in card_type:
-             return "https://raw.githubusercontent.com/muhammederdem/credit-card-form/master/src/assets/images/amex.png"
-        return "https://raw.githubusercontent.com/muhammederdem/credit-card-form/master/src/assets/images/chip.png"
+        return card_image_url(obj.card_type or "")
+
+    def to_representation(self, instance):
+        # Every rendered field is a plain string, boolean or id column, or the logo
+        # lookup, so build the dict directly rather than through each field's
+        # get_attribute/to_representation, which dominates the cost of card lists
+        return {
+            name: self.get_image(instance) if name == 'image' else getattr(instance, name)
+            for name in self.rendered_fields
+        }
 
 class PaymentSerializer(serializers.ModelSerializer):
     class Meta:
@@ -4,7 +4,9 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.urls import reverse
+from rest_framework import serializers
 from ..models import PaymentMethod
+from ..serializers import PaymentMethodSerializer
 from users.models import User, UserType
 from django.contrib.auth.hashers import make_password
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -298,3 +300,17 @@ class PaymentMethodTests(APITestCase):
         client = self.get_auth_client(self.technician_user)
         response = client.delete(self.detail_url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class PaymentMethodSerializerTests(APITestCase):
+    def test_fast_representation_matches_the_generic_one(self):
+        user = User.objects.create_user(email='card-owner@example.com', user_type_name='client')
+        card = PaymentMethod.objects.create(
+            user=user, masked_pan='5123', card_type='MasterCard', expiration_date='10/2030',
+            card_holder_name='Card Owner', is_default=True,
+        )
+        serializer = PaymentMethodSerializer()
+        self.assertEqual(
+            serializer.to_representation(card),
+            dict(serializers.ModelSerializer.to_representation(serializer, card)),
+        )
@@ -3,8 +3,9 @@ from rest_framework import status
 from django.urls import reverse
 from users.models import User, UserType
 from transactions.models import Transaction
-from payments.models import PaymentMethod # Import PaymentMethod
-from django.db import transaction as db_transaction
+from payments.models import Payment, PaymentMethod # Import PaymentMethod
+from django.db import connection, transaction as db_transaction
+from django.test.utils import CaptureQueriesContext
 from technicians.models import VerificationDocument # Added for technician verification documents
 from services.models import Service, ServiceCategory # Added for Service and ServiceCategory
 from django.utils import timezone # Import timezone for PaymentMethod creation
@@ -210,3 +211,35 @@ class PaymentViewsTest(APITestCase):
         data = {'amount': 10.00, 'payment_method_id': self.client_payment_method.id}
         response = client.post(self.withdraw_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PaymentListQueryTests(APITestCase):
+    """
+    PaymentSerializer renders user, order and payment_method as bare ids, read from the
+    payment row, and PaymentMethodSerializer does not render its user at all, so
+    neither list needs select_related; these tests keep it that way.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user(email='payer@example.com', user_type_name='client')
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.user)
+
+    def _add_payments(self, count):
+        for _ in range(count):
+            method = PaymentMethod.objects.create(
+                user=self.user, masked_pan=f'{PaymentMethod.objects.count():04d}', card_type='Visa'
+            )
+            Payment.objects.create(user=self.user, amount=10, payment_method=method)
+
+    def _count_queries(self, url_name):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.get(reverse(url_name))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries)
+
+    def test_list_query_counts_do_not_grow_with_rows(self):
+        self._add_payments(1)
+        payments, methods = self._count_queries('payment-list'), self._count_queries('paymentmethod-list')
+        self._add_payments(3)
+        self.assertEqual(self._count_queries('payment-list'), payments)
+        self.assertEqual(self._count_queries('paymentmethod-list'), methods)
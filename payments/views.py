@@ -49,7 +49,7 @@ class PaymentMethodViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
         user = self.request.user
         base_queryset = super().get_queryset()
 
-        if user.is_authenticated and user.user_type.user_type_name in ['client', 'technician', 'admin']:
+        if user.is_authenticated and user.role_name in ['client', 'technician', 'admin']:
             return base_queryset.filter(user=user)
         else:
             return base_queryset.none()
@@ -59,7 +59,7 @@ class PaymentMethodViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
         if not user.is_authenticated:
             raise PermissionDenied("Authentication required to create payment methods.")
 
-        if user.user_type.user_type_name == 'admin':
+        if user.role_name == 'admin':
             if 'user' in self.request.data:
                 serializer.save()
             else:
@@ -90,9 +90,9 @@ class PaymentViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
         user = self.request.user
         base_queryset = super().get_queryset()
 
-        if user.is_authenticated and user.user_type.user_type_name == 'admin':
+        if user.is_authenticated and user.role_name == 'admin':
             return base_queryset
-        elif user.is_authenticated and user.user_type.user_type_name in ['client', 'technician']:
+        elif user.is_authenticated and user.role_name in ['client', 'technician']:
             return base_queryset.filter(user=user)
         return base_queryset.none()
 
@@ -432,7 +432,7 @@ class PaymentViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
         if not user.is_authenticated:
             raise PermissionDenied("Authentication required to create payments.")
 
-        if user.user_type.user_type_name == 'admin':
+        if user.role_name == 'admin':
             if 'user' in self.request.data:
                 serializer.save()
             else:
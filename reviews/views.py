@@ -59,12 +59,12 @@ class ReviewViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         user = self.request.user
         if user.is_authenticated:
-            if user.user_type.user_type_name == 'admin':
+            if user.role_name == 'admin':
                 return Review.objects.all()
-            elif user.user_type.user_type_name == 'client':
+            elif user.role_name == 'client':
                 # Clients can see reviews they made or reviews for technicians they hired
                 return Review.objects.filter(reviewer=user) | Review.objects.filter(technician__in=user.client_orders.values_list('technician_user', flat=True))
-            elif user.user_type.user_type_name == 'technician':
+            elif user.role_name == 'technician':
                 # Technicians can see reviews they received or reviews they made (as a client)
                 return Review.objects.filter(technician=user) | Review.objects.filter(reviewer=user)
         return Review.objects.none() # Unauthenticated users cannot list/retrieve reviews
@@ -139,7 +139,7 @@ class WorkerReviewsViewSet(viewsets.ReadOnlyModelViewSet):
             return Review.objects.none()
 
         # Only technicians can access this endpoint
-        if user.user_type.user_type_name != 'technician':
+        if user.role_name != 'technician':
             return Review.objects.none()
 
         # Return reviews where this technician is the one being reviewed
@@ -79,7 +79,7 @@ cloudinary.config(
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.SelectRelatedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication', # Added for DRF browsable API login persistence
     ),
     'DEFAULT_PERMISSION_CLASSES': (
@@ -272,7 +272,13 @@ DATABASES = {
         'OPTIONS': {
             'sslmode': 'require',
         },
-        'CONN_MAX_AGE': 0,  # Increased to 10 minutes for RAG system optimization
+        # Keep each worker's connection open between requests instead of paying the TLS
+        # and authentication handshake every time; 0 closes it after each request.
+        # Mind the server's connection limit: each gunicorn worker holds one connection.
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_CONN_MAX_AGE', 60)),
+        # Test a reused connection before the request uses it, so one the server or
+        # network dropped while idle is replaced instead of failing the request
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -334,8 +340,17 @@ DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.CloudinaryMediaStorage'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'users.User'
+# Session logins (admin, browsable API) load the user's UserType with the user
+AUTHENTICATION_BACKENDS = ['api.authentication.SelectRelatedModelBackend']
 # Paymob Configuration
 PAYMOB_API_KEY = os.environ.get('PAYMOB_API_KEY')
 PAYMOB_INTEGRATION_ID = os.environ.get('PAYMOB_INTEGRATION_ID')
 PAYMOB_IFRAME_ID = os.environ.get('PAYMOB_IFRAME_ID')
 PAYMOB_HMAC_SECRET = os.environ.get('PAYMOB_HMAC_SECRET')
+
+# Order/offer list response caching
+# Seconds to cache each user's order and project-offer list responses, and the admin
+# user ids that new disputes notify; 0 disables both.
+# Invalidation goes through the cache itself, so only enable this with a CACHES backend
+# shared by every worker process (e.g. memcached or Redis), not the default local-memory one.
+ORDER_LIST_CACHE_TIMEOUT = int(os.environ.get('ORDER_LIST_CACHE_TIMEOUT', 0))
@@ -77,11 +77,11 @@ class TechnicianAvailabilityViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelVi
 
         if self.action == 'list':
             if user.is_authenticated:
-                if user.user_type.user_type_name == 'client':
+                if user.role_name == 'client':
                     return queryset # Clients see all availabilities
-                elif user.user_type.user_type_name == 'technician':
+                elif user.role_name == 'technician':
                     return queryset.filter(technician_user=user) # Technicians see their own
-                elif user.user_type.user_type_name == 'admin':
+                elif user.role_name == 'admin':
                     return queryset # Admins see all
             else:
                 # If unauthenticated, check if read-only permissions allow listing all.
@@ -90,7 +90,7 @@ class TechnicianAvailabilityViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelVi
                 return queryset.none()
         
         # For detail actions (retrieve, update, destroy), filter for technicians to ensure 404 for unauthorized access
-        if user.is_authenticated and user.user_type.user_type_name == 'technician':
+        if user.is_authenticated and user.role_name == 'technician':
             return queryset.filter(technician_user=user)
 
         return queryset
@@ -140,7 +140,7 @@ class TechnicianSkillViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
     def get_permissions(self):
         if self.action == 'create':
             user = self.request.user
-            if user.is_authenticated and user.user_type.user_type_name == 'technician':
+            if user.is_authenticated and user.role_name == 'technician':
                 requested_technician_user_id = self.request.data.get('technician_user')
                 if requested_technician_user_id and requested_technician_user_id != user.user_id:
                     raise PermissionDenied("Technicians can only create skills for themselves.")
@@ -157,11 +157,11 @@ class TechnicianSkillViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
 
         if self.action == 'list':
             if user.is_authenticated:
-                if user.user_type.user_type_name == 'admin':
+                if user.role_name == 'admin':
                     return queryset # Admin sees all
-                elif user.user_type.user_type_name == 'technician':
+                elif user.role_name == 'technician':
                     return queryset.filter(technician_user=user) # Technician sees their own
-                elif user.user_type.user_type_name == 'client':
+                elif user.role_name == 'client':
                     return queryset # Client sees all
             else: # Unauthenticated users
                 if any(isinstance(perm, permissions.AllowAny) or isinstance(perm, IsAuthenticatedOrReadOnly) for perm in self.get_permissions()):
@@ -169,7 +169,7 @@ class TechnicianSkillViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
                 return queryset.none()
         
         # For detail actions, filter for technicians to ensure 404 for unauthorized access
-        if user.is_authenticated and user.user_type.user_type_name == 'technician':
+        if user.is_authenticated and user.role_name == 'technician':
             return queryset.filter(technician_user=user)
 
         return queryset
@@ -179,9 +179,9 @@ class TechnicianSkillViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
         if not user.is_authenticated:
             raise PermissionDenied("Authentication required to create skills.")
 
-        if user.user_type.user_type_name == 'technician':
+        if user.role_name == 'technician':
             serializer.save(technician_user=user)
-        elif user.user_type.user_type_name == 'admin':
+        elif user.role_name == 'admin':
             if 'technician_user' not in self.request.data:
                 raise serializers.ValidationError({"technician_user": "This field is required for admin users."})
             serializer.save()
@@ -194,7 +194,7 @@ class EarningsSummaryAPIView(APIView):
 
     def get(self, request, *args, **kwargs):
         user = request.user
-        if not user.is_authenticated or user.user_type.user_type_name != 'technician':
+        if not user.is_authenticated or user.role_name != 'technician':
             raise PermissionDenied("Only authenticated technicians can view earnings summaries.")
 
         today = timezone.now().date()
@@ -265,7 +265,7 @@ class WorkerSummaryAPIView(APIView):
 
     def get(self, request, *args, **kwargs):
         user = request.user
-        if not user.is_authenticated or user.user_type.user_type_name not in ['technician', 'admin']:
+        if not user.is_authenticated or user.role_name not in ['technician', 'admin']:
             raise PermissionDenied("Only authenticated technicians and admins can view worker summaries.")
 
         # Calculate active tasks - include all statuses that represent ongoing work
@@ -316,7 +316,7 @@ class MonthlyPerformanceAPIView(APIView):
 
     def get(self, request, *args, **kwargs):
         user = request.user
-        if not user.is_authenticated or user.user_type.user_type_name != 'technician':
+        if not user.is_authenticated or user.role_name != 'technician':
             raise PermissionDenied("Only authenticated technicians can view monthly performance.")
 
         today = timezone.now().date()
@@ -373,7 +373,7 @@ class WorkerReviewsAPIView(APIView):
 
     def get(self, request, *args, **kwargs):
         user = request.user
-        if not user.is_authenticated or user.user_type.user_type_name != 'technician':
+        if not user.is_authenticated or user.role_name != 'technician':
             raise PermissionDenied("Only authenticated technicians can view worker reviews.")
 
         # Get reviews for this technician
@@ -518,7 +518,7 @@ class VerificationDocumentViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelView
             # Object-level permissions will handle access control (403 if forbidden).
             return base_queryset
         
-        if user.is_authenticated and user.user_type.user_type_name == 'admin':
+        if user.is_authenticated and user.role_name == 'admin':
             return base_queryset # Admin sees all for list actions
         elif user.is_authenticated:
             return self.get_filtered_queryset(user, base_queryset) # Authenticated non-admin users get filtered for list actions
@@ -526,9 +526,9 @@ class VerificationDocumentViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelView
             return base_queryset.none()
 
     def get_filtered_queryset(self, user, base_queryset):
-        if user.user_type.user_type_name == 'technician':
+        if user.role_name == 'technician':
             return base_queryset.filter(technician_user=user)
-        elif user.user_type.user_type_name == 'admin':
+        elif user.role_name == 'admin':
             return base_queryset # Admins can see all verification documents
         return base_queryset.none()
 
@@ -539,7 +539,7 @@ class VerificationDocumentViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelView
 
         # Determine target user
         technician_user = user
-        if user.user_type.user_type_name == 'admin':
+        if user.role_name == 'admin':
             requested_id = request.data.get('technician_user')
             if requested_id:
                 try:
@@ -548,12 +548,12 @@ class VerificationDocumentViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelView
                     raise serializers.ValidationError({"technician_user": "User not found."})
             else:
                 raise serializers.ValidationError({"technician_user": "This field is required for admin users."})
-        elif user.user_type.user_type_name not in ['technician', 'client']:
+        elif user.role_name not in ['technician', 'client']:
             raise PermissionDenied("Only clients, technicians and admins can create verification documents.")
         
         # For non-admins, ensure they are creating for themselves
         requested_technician_user_id = request.data.get('technician_user')
-        if user.user_type.user_type_name != 'admin' and requested_technician_user_id and str(requested_technician_user_id) != str(user.user_id):
+        if user.role_name != 'admin' and requested_technician_user_id and str(requested_technician_user_id) != str(user.user_id):
              raise PermissionDenied("Users can only create verification documents for themselves.")
 
         # Handle file uploads and document creation
@@ -641,9 +641,9 @@ class VerificationDocumentViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelView
     def perform_create(self, serializer):
         # Kept for standard create calls (fallback)
         user = self.request.user
-        if user.user_type.user_type_name in ['technician', 'client']:
+        if user.role_name in ['technician', 'client']:
             serializer.save(technician_user=user)
-        elif user.user_type.user_type_name == 'admin':
+        elif user.role_name == 'admin':
             # For admin, technician_user should be provided in the request data for this path
             technician_user_id = self.request.data.get('technician_user')
             if technician_user_id:
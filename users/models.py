@@ -95,6 +95,22 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return self.email
 
+    @property
+    def role_name(self):
+        """
+        The user's role ('admin', 'client', 'technician', ...), i.e. user_type.user_type_name.
+        Resolved once per instance and re-resolved only if user_type_id changes.
+
+        Roles are compared by name rather than by user_type_id: UserType rows are created
+        on demand (see CustomUserManager.create_user), so their ids differ between
+        databases and cannot be baked into constants.
+        """
+        cached = self.__dict__.get('_role_cache')
+        if cached is None or cached[0] != self.user_type_id:
+            role = self.user_type.user_type_name if self.user_type_id is not None else None
+            cached = self.__dict__['_role_cache'] = (self.user_type_id, role)
+        return cached[1]
+
     def get_full_name(self):
         return f"{self.first_name} {self.last_name}"
 
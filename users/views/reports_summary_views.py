@@ -16,7 +16,7 @@ class ReportsSummaryAPIView(APIView):
     permission_classes = [IsAdminUser]
 
     def get(self, request, *args, **kwargs):
-        if not request.user.user_type.user_type_name == 'admin':
+        if not request.user.role_name == 'admin':
             return Response({"detail": "You are not authorized to view reports summary."},
                             status=status.HTTP_403_FORBIDDEN)
 
@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from django.shortcuts import get_object_or_404
 from django.http import HttpResponseRedirect
+from django.db import transaction
 from users.models import User, UserType
 from users.serializers import UserTypeSerializer, UserSerializer, PublicUserSerializer
 from api.permissions import IsAdminUser, IsOwnerOrAdmin, IsClientUser, IsTechnicianUser
@@ -11,7 +12,7 @@ from api.mixins import OwnerFilteredQuerysetMixin
 from orders.models import Order, ProjectOffer
 from orders.serializers import OrderSerializer, ClientMakeOfferSerializer, ProjectOfferSerializer
 from notifications.models import Notification
-from notifications.utils import create_notification
+from notifications.utils import create_notification_on_commit
 from notifications.arabic_translations import ARABIC_NOTIFICATIONS
 from datetime import date
 from rest_framework.exceptions import PermissionDenied, NotFound, ValidationError
@@ -213,28 +214,21 @@ class UserViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
             context={'request': request}
         )
         serializer.is_valid(raise_exception=True)
-        offer = serializer.save() # The create method in the serializer handles Order and ProjectOffer creation
-
-        # Extract order and technician from the created offer for notification and response
-        order = offer.order
-        
-        # Ensure the order status is set to AWAITING_TECHNICIAN_RESPONSE
-        if order.order_status != 'AWAITING_TECHNICIAN_RESPONSE':
-            order.order_status = 'AWAITING_TECHNICIAN_RESPONSE'
-            order.save(update_fields=['order_status'])
-        
-        # Send notification to the technician
-        try:
-            create_notification(
-                user=technician_user,
-                notification_type='new_direct_offer',
-                title=ARABIC_NOTIFICATIONS['new_direct_offer_title'],
-                message=ARABIC_NOTIFICATIONS['new_direct_offer_message'].format(user_name=offer_initiator_user.get_full_name(), order_id=order.order_id),
-                related_order=order,
-                related_offer=offer
-            )
-        except Exception as e:
-            print(f"Error sending notification for new client offer: {e}")
+        with transaction.atomic():
+            offer = serializer.save() # The create method in the serializer handles Order and ProjectOffer creation
+
+            # Extract order and technician from the created offer for notification and response
+            order = offer.order
+
+        # Send notification to the technician once the offer is committed
+        create_notification_on_commit(
+            user=technician_user,
+            notification_type='new_direct_offer',
+            title=ARABIC_NOTIFICATIONS['new_direct_offer_title'],
+            message=ARABIC_NOTIFICATIONS['new_direct_offer_message'].format(user_name=offer_initiator_user.get_full_name(), order_id=order.order_id),
+            related_order=order,
+            related_offer=offer
+        )
 
         return Response({
             'message': 'Offer sent to technician successfully.',
@@ -248,7 +242,7 @@ class UserViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
         Technician responds to a client's direct offer (accept/reject).
         """
         technician_user = request.user
-        if not technician_user.is_authenticated or technician_user.user_type.user_type_name != 'technician':
+        if not technician_user.is_authenticated or technician_user.role_name != 'technician':
             raise PermissionDenied("Only authenticated technicians can respond to client offers.")
 
         try:
@@ -270,7 +264,7 @@ class UserViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
         if action_type == 'accept':
             order.technician_user = technician_user
             order.order_status = 'AWAITING_CLIENT_ESCROW_CONFIRMATION'
-            order.save()
+            order.save(update_fields=['technician_user', 'order_status'])
 
             # The offer status remains 'pending' until the client accepts and funds the escrow.
             # offer.status = 'accepted' # COMMENTED OUT: Offer status should remain pending here
@@ -283,7 +277,7 @@ class UserViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
                 f'Technician {technician_user.get_full_name()} has accepted your direct offer for order #{order.order_id}. '
                 'Please proceed to your dashboard to confirm the offer and fund the escrow to secure the service.'
             )
-            create_notification(
+            create_notification_on_commit(
                 user=order.client_user,
                 notification_type=notification_type,
                 title=ARABIC_NOTIFICATIONS['direct_offer_accepted_title'],
@@ -296,7 +290,7 @@ class UserViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
             rejection_reason = request.data.get('rejection_reason', 'No reason provided.')
             offer.status = 'rejected'
             offer.offer_description = f"{offer.offer_description} (Rejected: {rejection_reason})"
-            offer.save()
+            offer.save(update_fields=['status', 'offer_description'])
 
             # For rejection, consider if the order status should revert or become 'CLIENT_OFFER_REJECTED'
             # For now, let's keep it simple and just mark the offer as rejected.
@@ -308,7 +302,7 @@ class UserViewSet(OwnerFilteredQuerysetMixin, viewsets.ModelViewSet):
             notification_type = 'client_offer_rejected'
             notification_title = 'Your Direct Offer Was Rejected'
             notification_message = f'Technician {technician_user.get_full_name()} has rejected your direct offer for order #{order.order_id}. Reason: {rejection_reason}'
-            create_notification(
+            create_notification_on_commit(
                 user=order.client_user,
                 notification_type=notification_type,
                 title=ARABIC_NOTIFICATIONS['direct_offer_rejected_title'],